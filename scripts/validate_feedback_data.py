@@ -4,168 +4,271 @@
 检查是否有不符合标准格式的数据
 """
 import sqlite3
-import json
-from datetime import datetime
+import sys
 
 # 标准的 feedback 类型
-VALID_FEEDBACK_TYPES = {'resonance', 'rejection', 'ignore'}
+VALID_FEEDBACK_TYPES = frozenset({'resonance', 'rejection', 'ignore'})
 
 # 标准的 behavior 类型
-VALID_BEHAVIORS = {'agree', 'download', 'explain', 'comment', 'timeout'}
+VALID_BEHAVIORS = frozenset({'agree', 'download', 'explain', 'comment', 'timeout'})
+
+# behavior → feedback 的标准映射
+EXPECTED_FEEDBACK = {
+    'agree': 'resonance',
+    'download': 'resonance',
+    'explain': 'rejection',
+    'comment': 'ignore',
+    'timeout': 'ignore',
+}
+
+# extra_data 仅在是合法 JSON 时参与解析
+VALID_JSON_SQL = "CASE WHEN json_valid(extra_data) THEN extra_data END"
+BEHAVIOR_SQL = f"json_extract({VALID_JSON_SQL}, '$.behavior')"
+
+
+def _placeholders(values):
+    return ", ".join("?" for _ in values)
+
+
+# 问题记录只打印前几条
+SAMPLE_SIZE = 5
+
+# 结果按批次从 SQLite 取回
+FETCH_BATCH_SIZE = 10_000
+
+# 全表分析扫描：mmap 读取 + 大页缓存，临时 B 树与物化 CTE 放内存；脚本不写库
+READ_PRAGMAS = (
+    "PRAGMA mmap_size=1073741824",  # 1 GiB
+    "PRAGMA cache_size=-262144",    # 256 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA query_only=1",
+)
+
+# interactions 只扫描一次并物化为 stats，所有结果由首列 tag 区分：
+#   histogram:    按 feedback × behavior 分桶的计数（合法性判断也在 SQL 中完成）
+#   bad_json:     JSON 非法记录的 ID 样本
+#   bad_behavior: 非标准 behavior 记录的 ID 样本
+#   mismatch:     behavior→feedback 映射不匹配的样本（映射表以 VALUES 形式连接）
+# has_behavior / has_comment 按键是否存在判断（json_type），值为 null 也算存在；
+# 存在但不在标准列表中的 behavior（含 null）计为非标准，每行计一次
+SCAN_SQL = f"""
+    WITH
+        mapping(behavior, expected) AS (VALUES {", ".join("(?, ?)" for _ in EXPECTED_FEEDBACK)}),
+        stats AS MATERIALIZED (
+            SELECT
+                id,
+                feedback,
+                behavior,
+                is_empty,
+                has_comment,
+                is_bad_json,
+                has_behavior,
+                has_behavior AND IFNULL(behavior NOT IN ({_placeholders(VALID_BEHAVIORS)}), 1) AS is_bad_behavior
+            FROM (
+                SELECT
+                    id,
+                    feedback,
+                    {BEHAVIOR_SQL} AS behavior,
+                    IFNULL(extra_data, '') IN ('', '{{}}') AS is_empty,
+                    json_type({VALID_JSON_SQL}, '$.comment') IS NOT NULL AS has_comment,
+                    extra_data <> '' AND json_valid(extra_data) = 0 AS is_bad_json,
+                    json_type({VALID_JSON_SQL}, '$.behavior') IS NOT NULL AS has_behavior
+                FROM interactions
+            )
+        )
+    SELECT
+        'histogram' AS tag,
+        NULL AS id,
+        feedback,
+        behavior,
+        COUNT(*) AS total,
+        SUM(is_empty) AS empty,
+        SUM(has_comment) AS with_comment,
+        SUM(has_behavior) AS with_behavior,
+        IFNULL(SUM(is_bad_json), 0) AS bad_json,
+        SUM(is_bad_behavior) AS bad_behavior,
+        IFNULL(feedback IN ({_placeholders(VALID_FEEDBACK_TYPES)}), 0) AS feedback_ok,
+        NULL AS expected
+    FROM stats
+    GROUP BY feedback, behavior
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'bad_json', id, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+        FROM stats
+        WHERE is_bad_json
+        ORDER BY id
+        LIMIT ?
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'bad_behavior', id, NULL, behavior, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+        FROM stats
+        WHERE is_bad_behavior
+        ORDER BY id
+        LIMIT ?
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'mismatch', id, feedback, stats.behavior, NULL, NULL, NULL, NULL, NULL, NULL, NULL, expected
+        FROM stats
+        JOIN mapping ON mapping.behavior = stats.behavior
+        WHERE feedback <> expected
+        ORDER BY id
+        LIMIT ?
+    )
+"""
+SCAN_PARAMS = (
+    *(value for pair in EXPECTED_FEEDBACK.items() for value in pair),
+    *sorted(VALID_BEHAVIORS),
+    *sorted(VALID_FEEDBACK_TYPES),
+    SAMPLE_SIZE,
+    SAMPLE_SIZE,
+    SAMPLE_SIZE,
+)
+
 
 def validate_feedback_data(db_path='data/zenai.db'):
     """验证 feedback 数据"""
     conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
+    cursor.arraysize = FETCH_BATCH_SIZE
+    
+    for sql in READ_PRAGMAS:
+        cursor.execute(sql)
     
-    print("=" * 70)
-    print("ZenAi Feedback 数据验证")
-    print("=" * 70)
+    # 报告先收集到 lines，最后一次性写出
+    lines = []
+    lines.append("=" * 70)
+    lines.append("ZenAi Feedback 数据验证")
+    lines.append("=" * 70)
+    
+    # 一次全表扫描，后续只在聚合结果（几十行以内）和样本上求和
+    cursor.execute(SCAN_SQL, SCAN_PARAMS)
+    
+    total_count = 0
+    feedback_counts = {}
+    empty_count = 0
+    with_behavior = 0
+    with_comment = 0
+    invalid_json_count = 0
+    invalid_behavior_count = 0
+    nonstandard_feedback = set()
+    mismatch_count = 0
+    invalid_json_ids = []
+    invalid_behavior_samples = []
+    mismatch_samples = []
+    
+    while batch := cursor.fetchmany():
+        for row in batch:
+            tag = row['tag']
+            if tag == 'bad_json':
+                invalid_json_ids.append(row['id'])
+                continue
+            if tag == 'bad_behavior':
+                invalid_behavior_samples.append((row['id'], row['behavior']))
+                continue
+            if tag == 'mismatch':
+                mismatch_samples.append((row['id'], row['behavior'], row['feedback'], row['expected']))
+                continue
+            feedback = row['feedback']
+            behavior = row['behavior']
+            total = row['total']
+            total_count += total
+            feedback_counts[feedback] = feedback_counts.get(feedback, 0) + total
+            if not row['feedback_ok']:
+                nonstandard_feedback.add(feedback)
+            empty_count += row['empty']
+            with_comment += row['with_comment']
+            with_behavior += row['with_behavior']
+            invalid_json_count += row['bad_json']
+            invalid_behavior_count += row['bad_behavior']
+            expected = EXPECTED_FEEDBACK.get(behavior)
+            if expected and feedback != expected:
+                mismatch_count += total
     
     # 1. 检查总记录数
-    cursor.execute("SELECT COUNT(*) FROM interactions")
-    total_count = cursor.fetchone()[0]
-    print(f"\n总记录数: {total_count}")
+    lines.append(f"\n总记录数: {total_count}")
     
     # 2. 检查 feedback 字段
-    print("\n" + "=" * 70)
-    print("1. 验证 feedback 字段")
-    print("=" * 70)
-    
-    cursor.execute("""
-        SELECT feedback, COUNT(*) as count
-        FROM interactions
-        GROUP BY feedback
-    """)
+    lines.append("\n" + "=" * 70)
+    lines.append("1. 验证 feedback 字段")
+    lines.append("=" * 70)
     
     invalid_feedback = []
-    for row in cursor.fetchall():
-        feedback, count = row
-        if feedback in VALID_FEEDBACK_TYPES:
-            print(f"✅ {feedback}: {count} 条记录")
-        else:
-            print(f"⚠️  {feedback}: {count} 条记录 (非标准类型)")
+    for feedback, count in sorted(feedback_counts.items()):
+        if feedback in nonstandard_feedback:
+            lines.append(f"⚠️  {feedback}: {count} 条记录 (非标准类型)")
             invalid_feedback.append((feedback, count))
+        else:
+            lines.append(f"✅ {feedback}: {count} 条记录")
     
     # 3. 检查 extra_data 字段
-    print("\n" + "=" * 70)
-    print("2. 验证 extra_data 字段")
-    print("=" * 70)
+    lines.append("\n" + "=" * 70)
+    lines.append("2. 验证 extra_data 字段")
+    lines.append("=" * 70)
     
-    cursor.execute("SELECT id, extra_data FROM interactions")
+    lines.append(f"空 extra_data: {empty_count} 条 (旧数据，正常)")
+    lines.append(f"包含 behavior: {with_behavior} 条 (新数据)")
+    lines.append(f"包含 comment: {with_comment} 条 (有评论/解释)")
     
-    empty_count = 0
-    with_behavior = 0
-    with_comment = 0
-    invalid_json = []
-    invalid_behavior = []
-    
-    for row in cursor.fetchall():
-        interaction_id, extra_data_json = row
-        
-        try:
-            extra_data = json.loads(extra_data_json) if extra_data_json else {}
-            
-            # 统计
-            if not extra_data or extra_data == {}:
-                empty_count += 1
-            
-            if 'behavior' in extra_data:
-                with_behavior += 1
-                # 验证 behavior 值
-                if extra_data['behavior'] not in VALID_BEHAVIORS:
-                    invalid_behavior.append((interaction_id, extra_data['behavior']))
-            
-            if 'comment' in extra_data:
-                with_comment += 1
-                
-        except json.JSONDecodeError:
-            invalid_json.append(interaction_id)
-    
-    print(f"空 extra_data: {empty_count} 条 (旧数据，正常)")
-    print(f"包含 behavior: {with_behavior} 条 (新数据)")
-    print(f"包含 comment: {with_comment} 条 (有评论/解释)")
-    
-    if invalid_json:
-        print(f"\n⚠️  JSON 解析错误: {len(invalid_json)} 条")
-        print(f"   IDs: {invalid_json[:5]}...")
+    if invalid_json_count:
+        lines.append(f"\n⚠️  JSON 解析错误: {invalid_json_count} 条")
+        lines.append(f"   IDs: {invalid_json_ids}...")
     else:
-        print(f"\n✅ 所有 JSON 数据格式正确")
+        lines.append(f"\n✅ 所有 JSON 数据格式正确")
     
-    if invalid_behavior:
-        print(f"\n⚠️  非标准 behavior: {len(invalid_behavior)} 条")
-        for interaction_id, behavior in invalid_behavior[:5]:
-            print(f"   ID {interaction_id}: '{behavior}'")
+    if invalid_behavior_count:
+        lines.append(f"\n⚠️  非标准 behavior: {invalid_behavior_count} 条")
+        for interaction_id, behavior in invalid_behavior_samples:
+            lines.append(f"   ID {interaction_id}: '{behavior}'")
     else:
-        print(f"✅ 所有 behavior 类型正确")
+        lines.append(f"✅ 所有 behavior 类型正确")
     
     # 4. 数据完整性检查
-    print("\n" + "=" * 70)
-    print("3. 数据完整性检查")
-    print("=" * 70)
+    lines.append("\n" + "=" * 70)
+    lines.append("3. 数据完整性检查")
+    lines.append("=" * 70)
     
     # 检查是否有 feedback 和 behavior 不匹配的情况
-    cursor.execute("""
-        SELECT 
-            id,
-            feedback,
-            json_extract(extra_data, '$.behavior') as behavior
-        FROM interactions
-        WHERE json_extract(extra_data, '$.behavior') IS NOT NULL
-    """)
-    
-    mismatches = []
-    expected_mapping = {
-        'agree': 'resonance',
-        'download': 'resonance',
-        'explain': 'rejection',
-        'comment': 'ignore',
-        'timeout': 'ignore'
-    }
-    
-    for row in cursor.fetchall():
-        interaction_id, feedback, behavior = row
-        expected = expected_mapping.get(behavior)
-        if expected and feedback != expected:
-            mismatches.append((interaction_id, behavior, feedback, expected))
-    
-    if mismatches:
-        print(f"⚠️  映射不匹配: {len(mismatches)} 条")
-        for interaction_id, behavior, actual, expected in mismatches[:5]:
-            print(f"   ID {interaction_id}: behavior='{behavior}' → "
-                  f"feedback='{actual}' (应为 '{expected}')")
+    if mismatch_count:
+        lines.append(f"⚠️  映射不匹配: {mismatch_count} 条")
+        for interaction_id, behavior, actual, expected in mismatch_samples:
+            lines.append(f"   ID {interaction_id}: behavior='{behavior}' → "
+                              f"feedback='{actual}' (应为 '{expected}')")
     else:
-        print(f"✅ 所有 behavior→feedback 映射正确")
+        lines.append(f"✅ 所有 behavior→feedback 映射正确")
     
     # 5. 总结
-    print("\n" + "=" * 70)
-    print("验证总结")
-    print("=" * 70)
+    lines.append("\n" + "=" * 70)
+    lines.append("验证总结")
+    lines.append("=" * 70)
     
     issues = []
     if invalid_feedback:
         issues.append(f"非标准 feedback 类型: {len(invalid_feedback)} 种")
-    if invalid_json:
-        issues.append(f"JSON 格式错误: {len(invalid_json)} 条")
-    if invalid_behavior:
-        issues.append(f"非标准 behavior: {len(invalid_behavior)} 条")
-    if mismatches:
-        issues.append(f"映射不匹配: {len(mismatches)} 条")
+    if invalid_json_count:
+        issues.append(f"JSON 格式错误: {invalid_json_count} 条")
+    if invalid_behavior_count:
+        issues.append(f"非标准 behavior: {invalid_behavior_count} 条")
+    if mismatch_count:
+        issues.append(f"映射不匹配: {mismatch_count} 条")
     
     if issues:
-        print("\n⚠️  发现以下问题:")
+        lines.append("\n⚠️  发现以下问题:")
         for issue in issues:
-            print(f"   - {issue}")
-        print("\n建议运行修复脚本进行数据清理")
+            lines.append(f"   - {issue}")
+        lines.append("\n建议运行修复脚本进行数据清理")
     else:
-        print("\n🎉 数据验证通过！所有数据格式正确。")
-        print("\n数据分布:")
-        print(f"   - 旧数据（无 behavior）: {empty_count} 条")
-        print(f"   - 新数据（有 behavior）: {with_behavior} 条")
-        print(f"   - 包含评论/解释: {with_comment} 条")
+        lines.append("\n🎉 数据验证通过！所有数据格式正确。")
+        lines.append("\n数据分布:")
+        lines.append(f"   - 旧数据（无 behavior）: {empty_count} 条")
+        lines.append(f"   - 新数据（有 behavior）: {with_behavior} 条")
+        lines.append(f"   - 包含评论/解释: {with_comment} 条")
     
     conn.close()
-    print("\n" + "=" * 70)
+    lines.append("\n" + "=" * 70)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     validate_feedback_data()
@@ -13,18 +13,14 @@ from pathlib import Path
 
 from . import __version__
 from .config import load_config
-from .core.models import PromptPolicy
-from .core.prompt import render_prompt
-from .llm.config import load_llm_config
-from .monitoring import SystemMonitor
-from .orator import ZenAiOrator
-from .safety import SafetyController
-from .storage import ResonanceArchive
 
 
 def cmd_status(args):
     """Show system status"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    from .monitoring import SystemMonitor
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     monitor = SystemMonitor(archive)
     
     metrics = monitor.get_current_metrics()
@@ -67,7 +63,10 @@ def cmd_status(args):
 
 def cmd_freeze(args):
     """Freeze system evolution"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    from .safety import SafetyController
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     safety = SafetyController(archive)
     safety.freeze()
     print("System evolution FROZEN. / 系统演化已冻结。")
@@ -75,7 +74,10 @@ def cmd_freeze(args):
 
 def cmd_unfreeze(args):
     """Unfreeze system evolution"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    from .safety import SafetyController
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     safety = SafetyController(archive)
     safety.unfreeze()
     print("System evolution UNFROZEN. / 系统演化已解冻。")
@@ -83,7 +85,10 @@ def cmd_unfreeze(args):
 
 def cmd_rollback(args):
     """Rollback to previous prompt version"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    from .safety import SafetyController
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     safety = SafetyController(archive)
     
     try:
@@ -97,7 +102,10 @@ def cmd_rollback(args):
 
 def cmd_kill(args):
     """Kill the system"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    from .safety import SafetyController
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     safety = SafetyController(archive)
     
     if not args.confirm:
@@ -110,7 +118,10 @@ def cmd_kill(args):
 
 def cmd_history(args):
     """Show iteration history"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    from .monitoring import SystemMonitor
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     monitor = SystemMonitor(archive)
     
     history = monitor.get_iteration_history(n=args.limit)
@@ -135,7 +146,10 @@ def cmd_history(args):
 
 def cmd_prompts(args):
     """Show prompt evolution history"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    from .monitoring import SystemMonitor
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     monitor = SystemMonitor(archive)
     
     history = monitor.get_prompt_evolution_history()
@@ -155,7 +169,10 @@ def cmd_prompts(args):
 
 def cmd_export(args):
     """Export metrics to JSON"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    from .monitoring import SystemMonitor
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     monitor = SystemMonitor(archive)
     
     monitor.export_metrics_json(args.output)
@@ -164,7 +181,9 @@ def cmd_export(args):
 
 def cmd_gathas(args):
     """View gatha history with explanations"""
-    archive = ResonanceArchive(db_path=args.db_path)
+    from .storage import ResonanceArchive
+    
+    archive = ResonanceArchive(db_path=args.db_path, pool_size=args.db_pool_size)
     gathas = archive.get_all_gathas(limit=args.limit)
     
     if not gathas:
@@ -220,10 +239,10 @@ def cmd_gathas(args):
 def cmd_iterate(args):
     """Manually trigger an iteration cycle"""
     from datetime import datetime, timedelta
-    from .config import load_config
     from .trainer import ZenAiTrainer
     from .orator import ZenAiOrator
     from .llm.config import load_llm_config
+    from .storage import ResonanceArchive
     
     print("\n" + "=" * 60)
     print("Manual Iteration Trigger / 手动触发迭代")
@@ -234,7 +253,7 @@ def cmd_iterate(args):
     db_path = args.db_path or config.paths.database
     
     # Initialize components
-    archive = ResonanceArchive(db_path=db_path)
+    archive = ResonanceArchive(db_path=db_path, pool_size=config.paths.database_pool_size)
     
     # Check interaction count
     total_interactions = archive.get_interaction_count()
@@ -327,9 +346,7 @@ def cmd_iterate(args):
 
 
 def build_parser() -> argparse.ArgumentParser:
-    # Load config to get database path (no hardcoded defaults)
-    config = load_config()
-    
+    # Parser construction stays free of file I/O; database path comes from --config in main()
     parser = argparse.ArgumentParser(
         description="ZenAi Admin Tool / ZenAi 管理工具"
     )
@@ -343,7 +360,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--db-path",
         type=str,
         default=None,
-        help=f"Path to SQLite database (default: {config.paths.database})",
+        help="Path to SQLite database (default: paths.database from --config)",
     )
     
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
@@ -437,6 +454,7 @@ def main() -> int:
     config = load_config(args.config)
     if not args.db_path:
         args.db_path = config.paths.database
+    args.db_pool_size = config.paths.database_pool_size
     
     commands = {
         "status": cmd_status,
@@ -1,34 +1,58 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import hmac
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Dict, List, Union
+from types import MappingProxyType
+from typing import Any, Literal, Optional, Dict, List, Union
 
-from fastapi import FastAPI, HTTPException, status
+import anyio.to_thread
+import httpx
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from .. import __version__
+from ..config import ZenAiConfig
 from ..core.models import PromptPolicy
 from ..core.prompt import render_prompt
-from ..llm import load_llm_config
+from ..llm import LLMConfig, ResponseCache, load_llm_config
 from ..orator import ZenAiOrator
-from ..storage import ResonanceArchive
+from ..storage import FeedbackWriter, ResonanceArchive
 from ..trainer import ZenAiTrainer
-from ..llm import send_chat_completion, LlmMessage
-from ..ken_wang.routes import ken_wang_router
+from ..llm import send_chat_completion_async, send_chat_completion_stream, LlmMessage
+from ..ken_wang.config import get_internal_api_key
+from ..ken_wang.routes import (
+    close_components as close_ken_wang_components,
+    ken_wang_router,
+    reset_components as reset_ken_wang_components,
+)
 
 
 # ========================================
 # Request/Response Models
 # ========================================
 
+# Supported UI languages; Literal validates by string equality instead of a regex
+Language = Literal['zh', 'zh-tw', 'en', 'ja', 'ko']
+
+
 class ChatRequest(BaseModel):
     """User chat input"""
     user_input: str = Field(..., min_length=1, max_length=10000)
     metadata: Optional[Dict[str, Any]] = None
-    language: str = Field(default='en', pattern='^(zh|zh-tw|en|ja|ko)$')
+    language: Language = 'en'
 
 
 class ChatResponse(BaseModel):
@@ -103,7 +127,7 @@ class ExplainRequest(BaseModel):
     """Request for explaining a Zen answer"""
     question: str = Field(..., min_length=1, max_length=10000)
     zen_answer: str = Field(..., min_length=1, max_length=10000)
-    language: str = Field(default='en', pattern='^(zh|zh-tw|en|ja|ko)$')
+    language: Language = 'en'
 
 
 class ExplainResponse(BaseModel):
@@ -129,16 +153,73 @@ class GenerateResponse(BaseModel):
 # Application State
 # ========================================
 
+# Response timestamps come from a clock refreshed on this interval instead of
+# datetime.utcnow() per request (interaction records keep exact timestamps)
+CLOCK_TICK_SECONDS = 0.05
+
+# /gathas only changes when an iteration completes; responses are reused per
+# (limit, latest iteration id) for gathas_cache.ttl_seconds (gathas are saved just
+# after the iteration row); gathas_cache.max_limit bounds the entries per iteration
+_gathas_cache: dict[tuple[int, int | None], tuple[float, GathasResponse, str]] = {}
+_gathas_refill_locks: dict[tuple[int, int | None], threading.Lock] = {}  # single-flight per key
+_gathas_cache_lock = threading.Lock()  # guards the two dicts above, never held while loading
+
+# Request-path logging under the "zenai" namespace is queued and written by a
+# listener thread, so formatting tracebacks never blocks a handler
+zenai_logger = logging.getLogger("zenai")
+feedback_logger = logging.getLogger("zenai.feedback")
+api_logger = logging.getLogger("zenai.api")
+
+
 class AppState:
     """Global application state"""
+    config: ZenAiConfig | None = None
     archive: ResonanceArchive | None = None
     trainer: ZenAiTrainer | None = None
     orator: ZenAiOrator | None = None
+    feedback_writer: FeedbackWriter | None = None
+    llm_config: LLMConfig | None = None
+    response_cache: ResponseCache | None = None
+    http_client: httpx.AsyncClient | None = None
+    status_counts: tuple[float, tuple[int, int]] | None = None  # (fetched_at, counts)
+    frozen: bool = False
+    killed: bool = False
+    health_body: tuple[int, bytes] | None = None  # (epoch second, body)
+    now_utc: datetime | None = None
+    now_iso: str | None = None
 
 
 app_state = AppState()
 
 
+def _read_system_flags(archive: ResonanceArchive) -> tuple[bool, bool]:
+    return archive.is_frozen(), archive.is_killed()
+
+
+def _tick_clock() -> None:
+    now = datetime.utcnow()
+    app_state.now_utc, app_state.now_iso = now, now.isoformat()
+
+
+async def _run_clock(interval: float) -> None:
+    """Keep app_state.now_utc / app_state.now_iso current to within interval"""
+    while True:
+        await asyncio.sleep(interval)
+        _tick_clock()
+
+
+async def _refresh_system_flags(archive: ResonanceArchive, interval: float) -> None:
+    """Keep app_state.frozen / app_state.killed in sync with the archive"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            app_state.frozen, app_state.killed = await anyio.to_thread.run_sync(
+                _read_system_flags, archive
+            )
+        except Exception as exc:
+            api_logger.warning("[API] Failed to refresh system flags: %s", exc)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -158,14 +239,28 @@ async def lifespan(app: FastAPI):
     from ..config import load_config
     config = load_config()
     
+    # Endpoints that block on SQLite or the LLM are plain `def` and run in anyio's worker threads
+    anyio.to_thread.current_default_thread_limiter().total_tokens = config.api.worker_thread_limit
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    zenai_logger.addHandler(queue_handler)
+    zenai_logger.setLevel(logging.INFO)
+    zenai_logger.propagate = False
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, stdout_handler)
+    log_listener.start()
+    
     print("\n" + "="*60)
     print("ZenAi System Initialization / ZenAi 系统初始化")
     print("="*60)
     
     # 1. Initialize Archive (storage layer)
     db_path = config.paths.get_database_path()
-    archive = ResonanceArchive(db_path=db_path)
-    print(f"✓ Archive initialized: {db_path}")
+    archive = ResonanceArchive(db_path=db_path, pool_size=config.paths.database_pool_size)
+    archive.warm_up()
+    print(f"✓ Archive initialized: {db_path} ({archive.pool_size} pooled connections)")
     
     # 2. Initialize first prompt if needed
     latest_prompt = archive.get_latest_prompt()
@@ -192,6 +287,7 @@ async def lifespan(app: FastAPI):
     
     # 4. Initialize Orator (布道者)
     llm_config = load_llm_config()
+    response_cache = ResponseCache(max_entries=config.response_cache.max_entries)
     orator = ZenAiOrator(
         llm_config=llm_config,
         archive=archive,
@@ -199,9 +295,34 @@ async def lifespan(app: FastAPI):
     print(f"✓ Orator (布道者) initialized - verbal teaching through LLM")
     
     # Store in app state
+    app_state.config = config
     app_state.archive = archive
     app_state.trainer = trainer
     app_state.orator = orator
+    app_state.llm_config = llm_config
+    app_state.response_cache = response_cache
+    # Shared LLM HTTP client: HTTP/2 multiplexing over kept-alive TLS connections
+    app_state.http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=config.llm_http.max_keepalive_connections,
+            max_connections=config.llm_http.max_connections,
+        ),
+        timeout=httpx.Timeout(config.llm_http.timeout_seconds),
+    )
+    app_state.feedback_writer = FeedbackWriter(
+        archive,
+        max_pending=config.feedback_writer.max_pending,
+        batch_size=config.feedback_writer.batch_size,
+        flush_interval=config.feedback_writer.flush_interval_seconds,
+    )
+    app_state.feedback_writer.start()
+    app_state.frozen, app_state.killed = _read_system_flags(archive)
+    _tick_clock()
+    clock_task = asyncio.create_task(_run_clock(CLOCK_TICK_SECONDS))
+    flags_task = asyncio.create_task(
+        _refresh_system_flags(archive, config.api.system_flags_refresh_seconds)
+    )
     
     print("="*60)
     print("System ready / 系统就绪")
@@ -209,9 +330,15 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Cleanup (if needed)
+    # Cleanup
     print("\nShutting down ZenAi system...")
-    pass
+    flags_task.cancel()
+    clock_task.cancel()
+    app_state.feedback_writer.stop()
+    await app_state.http_client.aclose()
+    await close_ken_wang_components()
+    log_listener.stop()
+    zenai_logger.removeHandler(queue_handler)
 
 
 # ========================================
@@ -223,6 +350,7 @@ app = FastAPI(
     description="ZenAi Public Practice System API",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for cross-origin requests
@@ -242,19 +370,28 @@ app.include_router(ken_wang_router)
 # API Endpoints
 # ========================================
 
+# / and /health are polled by load balancers; their bodies are serialized ahead of time
+ROOT_BODY = orjson.dumps({
+    "service": "ZenAi Orator API",
+    "version": __version__,
+    "status": "operational",
+    "documentation": "/docs",
+})
+
+
 @app.get("/")
 async def root():
     """API root endpoint"""
-    return {
-        "service": "ZenAi Orator API",
-        "version": __version__,
-        "status": "operational",
-        "documentation": "/docs",
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
+
+
+def _sse_event(payload: dict[str, Any]) -> str:
+    """Encode one Server-Sent Events message"""
+    return f"data: {orjson.dumps(payload).decode()}\n\n"
 
 
 @app.post("/chat", response_model=ChatResponse, status_code=status.HTTP_200_OK)
-async def chat(request: ChatRequest):
+def chat(request: ChatRequest):
     """
     Send message to ZenAi Orator and receive response.
     
@@ -268,7 +405,7 @@ async def chat(request: ChatRequest):
         )
     
     # Check if system is killed
-    if app_state.archive and app_state.archive.is_killed():
+    if app_state.killed:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="System has been terminated",
@@ -280,7 +417,7 @@ async def chat(request: ChatRequest):
             metadata=request.metadata,
             language=request.language,
         )
-        return ChatResponse(
+        return ChatResponse.model_construct(
             interaction_id=response.interaction_id,
             response_text=response.response_text,
             refusal=response.refusal,
@@ -290,52 +427,134 @@ async def chat(request: ChatRequest):
     except Exception as exc:
         # Log full error internally but return generic message to user
         # to avoid exposing sensitive configuration details
+        api_logger.exception("[Chat] Error: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while processing request",
         )
 
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming variant of /chat (Server-Sent Events).
+    
+    Emits {"delta": ...} events as tokens arrive, then a final {"done": true, ...}
+    event carrying the interaction metadata once the interaction is recorded.
+    """
+    if not app_state.orator or not app_state.http_client:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Orator not initialized",
+        )
+    orator = app_state.orator
+    
+    # Check if system is killed
+    if app_state.killed:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="System has been terminated",
+        )
+    
+    try:
+        messages, policy, prompt_version = await anyio.to_thread.run_sync(
+            orator.prepare_messages, request.user_input, request.language
+        )
+    except Exception as exc:
+        api_logger.exception("[Chat Stream] Error preparing messages: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error while processing request",
+        )
+    temperature, max_tokens = orator.sampling_params(policy)
+    
+    async def event_stream():
+        parts: list[str] = []
+        error = None
+        try:
+            async for delta in send_chat_completion_stream(
+                config=orator.llm_config,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                http_client=app_state.http_client,
+            ):
+                parts.append(delta)
+                yield _sse_event({"delta": delta})
+        except Exception as exc:
+            error = exc
+        finally:
+            # Record the interaction even if the client disconnects mid-stream
+            with anyio.CancelScope(shield=True):
+                response = await anyio.to_thread.run_sync(
+                    lambda: orator.record_response(
+                        user_input=request.user_input,
+                        response_text="".join(parts),
+                        policy=policy,
+                        prompt_version=prompt_version,
+                        metadata=request.metadata,
+                        language=request.language,
+                        error=error,
+                    )
+                )
+        
+        yield _sse_event({
+            "done": True,
+            "interaction_id": response.interaction_id,
+            "refusal": response.refusal,
+            "error": error is not None,
+            "prompt_version": response.prompt_version,
+            "timestamp": response.timestamp.isoformat(),
+        })
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 """
 用户行为到反馈类型的映射规则
 集中管理，便于调整和扩展
 """
-BEHAVIOR_FEEDBACK_MAPPING = {
+BEHAVIOR_FEEDBACK_MAPPING = MappingProxyType({
     # 🟢 正面反馈 - Resonance
-    'agree': {
+    'agree': MappingProxyType({
         'feedback_type': 'resonance',
         'weight': 1.0,
         'description': '用户主动表示受到启发',
-    },
-    'download': {
+    }),
+    'download': MappingProxyType({
         'feedback_type': 'resonance',
         'weight': 0.8,
         'description': '用户认为对话有保存价值',
-    },
+    }),
     
     # 🔴 负面反馈 - Rejection
-    'explain': {
+    'explain': MappingProxyType({
         'feedback_type': 'rejection',
         'weight': 0.6,
         'description': '用户对回答感到困惑，需要更简单的表达',
-    },
+    }),
     
     # 🟡 中性反馈 - Ignore
-    'comment': {
+    'comment': MappingProxyType({
         'feedback_type': 'ignore',  # 默认中性，可通过情感分析调整
         'weight': 0.0,
         'description': '普通交流评论，可做进一步情感分析',
-    },
-    'timeout': {
+    }),
+    'timeout': MappingProxyType({
         'feedback_type': 'ignore',
         'weight': 0.0,
         'description': '用户阅读后未采取行动',
-    }
-}
+    }),
+})
+
+# 请求路径只需要 feedback_type：由上表派生的扁平查找表，description 仅在 DEBUG 日志中使用
+BEHAVIOR_FEEDBACK_TYPES = MappingProxyType({
+    behavior: rule['feedback_type'] for behavior, rule in BEHAVIOR_FEEDBACK_MAPPING.items()
+})
 
 
 @app.post("/feedback", response_model=FeedbackResponse, status_code=status.HTTP_200_OK)
-async def submit_feedback(request: FeedbackRequest):
+def submit_feedback(request: FeedbackRequest):
     """
     Submit user feedback based on behavior (静默反馈映射)
     
@@ -349,23 +568,19 @@ async def submit_feedback(request: FeedbackRequest):
     - comment (评论) → ignore (可通过情感分析调整)
     - timeout (无操作) → ignore
     """
-    if not app_state.archive:
+    if not app_state.archive or not app_state.feedback_writer:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Archive not initialized",
         )
     
     try:
-        # 1. 获取映射规则
-        mapping = BEHAVIOR_FEEDBACK_MAPPING.get(request.behavior)
+        # 1. 获取映射后的反馈类型
+        feedback_type = BEHAVIOR_FEEDBACK_TYPES.get(request.behavior)
         
-        if not mapping:
-            print(f"[Feedback] ⚠️  Unknown behavior: {request.behavior}, defaulting to 'ignore'")
+        if feedback_type is None:
+            feedback_logger.warning("[Feedback] ⚠️  Unknown behavior: %s, defaulting to 'ignore'", request.behavior)
             feedback_type = 'ignore'
-            description = f"Unknown behavior: {request.behavior}"
-        else:
-            feedback_type = mapping['feedback_type']
-            description = mapping['description']
         
         # 2. 可选：对评论内容做情感分析（未来扩展）
         # if request.behavior == 'comment' and request.comment:
@@ -375,11 +590,12 @@ async def submit_feedback(request: FeedbackRequest):
         #     elif sentiment_score < 0.3:
         #         feedback_type = 'rejection'
         
-        # 3. 构建要保存的详细数据
+        # 3. 构建要保存的详细数据（同一时间戳用于记录与响应）
+        now = app_state.now_utc
         feedback_data = {
             'behavior': request.behavior,
             'feedback_type': feedback_type,
-            'timestamp': request.timestamp or datetime.utcnow().isoformat(),
+            'timestamp': request.timestamp or now.isoformat(),
         }
         
         # 如果有评论内容，保存到 extra_data
@@ -388,34 +604,47 @@ async def submit_feedback(request: FeedbackRequest):
             feedback_data['comment_length'] = len(request.comment)
         
         # 4. 更新数据库：feedback字段存类型，extra_data存详细信息
-        app_state.archive.update_interaction_feedback(
-            interaction_id=request.interaction_id,
-            feedback=feedback_type,  # 标准类型
-            feedback_data=feedback_data,  # 详细数据
-        )
+        #    交给后台写线程批量提交；队列满时同步写入
+        if not app_state.feedback_writer.submit(
+            request.interaction_id,
+            feedback_type,  # 标准类型
+            feedback_data,  # 详细数据
+        ):
+            app_state.archive.update_interaction_feedback(
+                interaction_id=request.interaction_id,
+                feedback=feedback_type,
+                feedback_data=feedback_data,
+            )
         
         # 5. 日志记录
-        log_msg = (
-            f"[Feedback] ✓ Recorded: ID={request.interaction_id}, "
-            f"Behavior={request.behavior} → Type={feedback_type}"
-        )
         if request.comment:
-            log_msg += f", Comment='{request.comment[:50]}...'"
-        print(log_msg)
-        print(f"[Feedback]    Reason: {description}")
+            feedback_logger.info(
+                "[Feedback] ✓ Recorded: ID=%s, Behavior=%s → Type=%s, Comment='%s...'",
+                request.interaction_id, request.behavior, feedback_type, request.comment[:50],
+            )
+        else:
+            feedback_logger.info(
+                "[Feedback] ✓ Recorded: ID=%s, Behavior=%s → Type=%s",
+                request.interaction_id, request.behavior, feedback_type,
+            )
+        if feedback_logger.isEnabledFor(logging.DEBUG) and request.behavior in BEHAVIOR_FEEDBACK_MAPPING:
+            feedback_logger.debug(
+                "[Feedback]    Reason: %s", BEHAVIOR_FEEDBACK_MAPPING[request.behavior]['description'],
+            )
         
         # 6. 返回响应
-        return FeedbackResponse(
+        return FeedbackResponse.model_construct(
             interaction_id=request.interaction_id,
             behavior=request.behavior,
             feedback_type=feedback_type,
-            recorded_at=datetime.utcnow(),
+            recorded_at=now,
         )
         
     except Exception as exc:
-        print(f"[Feedback] ❌ Error: {exc}")
-        import traceback
-        traceback.print_exc()
+        feedback_logger.exception(
+            "[Feedback] ❌ Error: %s", exc,
+            extra={"interaction_id": request.interaction_id},
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while recording feedback",
@@ -423,7 +652,7 @@ async def submit_feedback(request: FeedbackRequest):
 
 
 @app.get("/status", response_model=StatusResponse)
-async def get_status():
+def get_status():
     """
     Get current system status.
     
@@ -436,24 +665,31 @@ async def get_status():
             detail="System not initialized",
         )
     
-    status_info = app_state.orator.get_system_status()
-    total_interactions = app_state.archive.get_interaction_count()
-    total_iterations = app_state.archive.get_iteration_count()
+    prompt = app_state.archive.get_latest_prompt()
     
-    return StatusResponse(
+    now = time.monotonic()
+    cached = app_state.status_counts
+    # /status is polled by dashboards; table counts are reused for api.status_counts_ttl_seconds
+    if cached and now - cached[0] < app_state.config.api.status_counts_ttl_seconds:
+        total_interactions, total_iterations = cached[1]
+    else:
+        total_interactions, total_iterations = app_state.archive.get_counts()
+        app_state.status_counts = (now, (total_interactions, total_iterations))
+    
+    return StatusResponse.model_construct(
         system_version=__version__,
-        prompt_version=status_info["prompt_version"],
-        current_iteration_id=status_info["current_iteration_id"],
-        frozen=status_info["frozen"],
-        killed=status_info["killed"],
-        policy=status_info["policy"],
+        prompt_version=prompt.version if prompt else 0,
+        current_iteration_id=app_state.orator.current_iteration_id,
+        frozen=app_state.frozen,
+        killed=app_state.killed,
+        policy=prompt.policy if prompt else {},
         total_interactions=total_interactions,
         total_iterations=total_iterations,
     )
 
 
 @app.get("/metrics", response_model=MetricsResponse)
-async def get_metrics():
+def get_metrics():
     """
     Get current iteration metrics.
     
@@ -467,13 +703,13 @@ async def get_metrics():
     
     latest_iteration = app_state.archive.get_latest_iteration()
     if not latest_iteration:
-        return MetricsResponse(
+        return MetricsResponse.model_construct(
             iteration_id=None,
             total_interactions=0,
             metrics=None,
         )
     
-    return MetricsResponse(
+    return MetricsResponse.model_construct(
         iteration_id=latest_iteration.id,
         total_interactions=latest_iteration.total_interactions,
         metrics=latest_iteration.metrics,
@@ -481,7 +717,11 @@ async def get_metrics():
 
 
 @app.get("/gathas", response_model=GathasResponse)
-async def get_recent_gathas(limit: int = 10):
+def get_recent_gathas(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=10, ge=1),
+):
     """
     Get recent gathas (Buddhist verses) with explanations.
     
@@ -490,7 +730,7 @@ async def get_recent_gathas(limit: int = 10):
     Each gatha includes a plain language explanation suitable for TTS audio generation.
     
     Args:
-        limit: Maximum number of gathas to return (default: 10)
+        limit: Maximum number of gathas to return (default: 10, at most gathas_cache.max_limit)
     
     Returns:
         Collection of recent gathas with complete data
@@ -501,10 +741,47 @@ async def get_recent_gathas(limit: int = 10):
             detail="Archive not initialized",
         )
     
+    gathas_config = app_state.config.gathas_cache
+    if limit > gathas_config.max_limit:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"limit must not exceed {gathas_config.max_limit}",
+        )
+    
+    cache_key = (limit, app_state.archive.get_latest_iteration_id())
+    with _gathas_cache_lock:
+        refill_lock = _gathas_refill_locks.setdefault(cache_key, threading.Lock())
+    
+    # Only requests for the same key wait on each other's refill
+    with refill_lock:
+        now = time.monotonic()
+        cached = _gathas_cache.get(cache_key)
+        if not cached or now - cached[0] >= gathas_config.ttl_seconds:
+            gathas_response = _load_recent_gathas(limit)
+            etag = '"{}"'.format(
+                hashlib.sha1(orjson.dumps(gathas_response.model_dump(mode="json"))).hexdigest()
+            )
+            cached = (now, gathas_response, etag)
+            with _gathas_cache_lock:
+                # A new iteration id makes every older entry unreachable
+                for key in [key for key in _gathas_refill_locks if key[1] != cache_key[1]]:
+                    del _gathas_refill_locks[key]
+                    _gathas_cache.pop(key, None)
+                _gathas_cache[cache_key] = cached
+    
+    _, gathas_response, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return gathas_response
+
+
+def _load_recent_gathas(limit: int) -> GathasResponse:
     gathas_data = app_state.archive.get_all_gathas(limit=limit)
     
+    # Rows come from our own archive; skip per-field validation
     gathas = [
-        GathaResponse(
+        GathaResponse.model_construct(
             iteration_id=g["iteration_id"],
             end_time=g.get("end_time"),
             state=g["state"],
@@ -521,11 +798,11 @@ async def get_recent_gathas(limit: int = 10):
         for g in gathas_data
     ]
     
-    return GathasResponse(gathas=gathas, count=len(gathas))
+    return GathasResponse.model_construct(gathas=gathas, count=len(gathas))
 
 
 @app.get("/gathas/{iteration_id}")
-async def get_gatha_by_iteration(iteration_id: int):
+def get_gatha_by_iteration(iteration_id: int):
     """
     Get complete gatha data for a specific iteration.
     
@@ -568,14 +845,73 @@ async def get_gatha_by_iteration(iteration_id: int):
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (timestamp has one-second resolution)"""
+    now = int(time.time())
+    cached = app_state.health_body
+    if not cached or cached[0] != now:
+        cached = (now, orjson.dumps({
+            "status": "healthy",
+            "version": __version__,
+            "timestamp": app_state.now_iso,
+        }))
+        app_state.health_body = cached
+    return Response(content=cached[1], media_type="application/json")
+
+
+def _require_internal_api_key(api_key: str | None) -> None:
+    """Ops endpoints need the internal API key; they are disabled when none is configured"""
+    expected = get_internal_api_key()
+    if (
+        not expected
+        or expected.startswith("${")  # unexpanded placeholder from config.yml.example
+        or not api_key
+        or not hmac.compare_digest(api_key.encode(), expected.encode())
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+
+@app.post("/reload-config")
+async def reload_llm_config(x_api_key: str | None = Header(default=None)):
+    """
+    Re-read LLM configuration from the environment (requires X-API-Key).
+    
+    Swaps the config used by /generate, the Orator and the Trainer's gatha
+    generator, and has the KenWang components rebuild on their next request.
+    Response caches are emptied since their entries came from the old model.
+    """
+    _require_internal_api_key(x_api_key)
+    
+    load_llm_config.cache_clear()
+    llm_config = load_llm_config()
+    app_state.llm_config = llm_config
+    if app_state.orator:
+        app_state.orator.llm_config = llm_config
+    if app_state.trainer and app_state.trainer.gatha_generator:
+        app_state.trainer.gatha_generator.llm_config = llm_config
+    if app_state.response_cache:
+        app_state.response_cache.clear()
+    reset_ken_wang_components()
+    
     return {
-        "status": "healthy",
-        "version": __version__,
+        "status": "reloaded",
+        "model": llm_config.model,
         "timestamp": datetime.utcnow().isoformat(),
     }
 
 
+def _generate_cache_key(request: GenerateRequest) -> tuple | None:
+    """Only greedy (temperature 0) completions are cached; sampled ones must vary between calls"""
+    if request.temperature != 0:
+        return None
+    return (
+        "generate",
+        app_state.llm_config.model,
+        request.prompt,
+        request.temperature,
+        request.max_tokens,
+    )
+
+
 @app.post("/generate", response_model=GenerateResponse, status_code=status.HTTP_200_OK)
 async def generate(request: GenerateRequest):
     """
@@ -593,35 +929,41 @@ async def generate(request: GenerateRequest):
     Returns:
         Generated text from LLM
     """
-    from ..llm import load_llm_config
+    if not app_state.llm_config or not app_state.response_cache or not app_state.http_client:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="LLM config not initialized",
+        )
+    
+    cache_key = _generate_cache_key(request)
+    cached = app_state.response_cache.get(cache_key) if cache_key else None
+    if cached is not None:
+        return GenerateResponse.model_construct(text=cached, timestamp=app_state.now_utc)
     
     try:
-        # Load LLM configuration
-        llm_config = load_llm_config()
-        
         # Build message
         messages = [
             LlmMessage(role="user", content=request.prompt)
         ]
         
         # Call LLM
-        response_text = send_chat_completion(
-            config=llm_config,
+        response_text = await send_chat_completion_async(
+            config=app_state.llm_config,
             messages=messages,
             temperature=request.temperature,
             max_tokens=request.max_tokens,
+            http_client=app_state.http_client,
         )
+        if cache_key:
+            app_state.response_cache.put(cache_key, response_text)
         
-        return GenerateResponse(
+        return GenerateResponse.model_construct(
             text=response_text,
-            timestamp=datetime.utcnow(),
+            timestamp=app_state.now_utc,
         )
         
     except Exception as exc:
-        # Log error
-        print(f"[LLM Generate] Error: {exc}")
-        import traceback
-        traceback.print_exc()
+        api_logger.exception("[LLM Generate] Error: %s", exc)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -629,8 +971,54 @@ async def generate(request: GenerateRequest):
         )
 
 
+@app.post("/generate/stream")
+async def generate_stream(request: GenerateRequest):
+    """
+    Streaming variant of /generate (Server-Sent Events).
+    
+    Emits {"delta": ...} events as tokens arrive, then {"done": true, ...}.
+    A cached completion (temperature 0 only) is sent as a single delta.
+    """
+    if not app_state.llm_config or not app_state.response_cache or not app_state.http_client:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="LLM config not initialized",
+        )
+    
+    llm_config = app_state.llm_config
+    response_cache = app_state.response_cache
+    cache_key = _generate_cache_key(request)
+    
+    async def event_stream():
+        cached = response_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            yield _sse_event({"delta": cached})
+        else:
+            parts: list[str] = []
+            try:
+                async for delta in send_chat_completion_stream(
+                    config=llm_config,
+                    messages=[LlmMessage(role="user", content=request.prompt)],
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens,
+                    http_client=app_state.http_client,
+                ):
+                    parts.append(delta)
+                    yield _sse_event({"delta": delta})
+            except Exception as exc:
+                api_logger.exception("[LLM Generate] Stream error: %s", exc)
+                yield _sse_event({"error": "LLM generation failed"})
+                return
+            if cache_key:
+                response_cache.put(cache_key, "".join(parts))
+        
+        yield _sse_event({"done": True, "timestamp": app_state.now_iso})
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/explain", response_model=ExplainResponse, status_code=status.HTTP_200_OK)
-async def explain_zen_answer(request: ExplainRequest):
+def explain_zen_answer(request: ExplainRequest):
     """
     Get a plain language explanation of a Zen answer.
     
@@ -651,9 +1039,9 @@ async def explain_zen_answer(request: ExplainRequest):
             zen_answer=request.zen_answer,
             language=request.language,
         )
-        return ExplainResponse(
+        return ExplainResponse.model_construct(
             explanation=explanation,
-            timestamp=datetime.utcnow(),
+            timestamp=app_state.now_utc,
         )
     except Exception as exc:
         # Log full error internally but return generic message to user
@@ -1,7 +1,7 @@
 """
 Configuration module for ZenAi system.
 """
-from .loader import load_config
+from .loader import clear_config_cache, load_config
 from .models import ZenAiConfig
 
-__all__ = ["load_config", "ZenAiConfig"]
+__all__ = ["load_config", "clear_config_cache", "ZenAiConfig"]
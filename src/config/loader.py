@@ -7,16 +7,30 @@ Missing parameters will cause immediate failure.
 """
 from __future__ import annotations
 
+import dataclasses
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml's C loader when PyYAML was built against it; same SafeLoader semantics
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from .models import (
+    ApiConfig,
     EvolutionRulesConfig,
+    FeedbackWriterConfig,
+    GathasCacheConfig,
     InitialPolicyConfig,
+    KenWangConfig,
+    LlmHttpConfig,
     PathConfig,
+    ResponseCacheConfig,
     SafetyThresholdsConfig,
     SchedulerConfig,
     StateThresholdsConfig,
@@ -24,6 +38,23 @@ from .models import (
 )
 
 
+# config.yml section name → dataclass; every field of each dataclass is a required parameter
+_SECTIONS: dict[str, type] = {
+    "paths": PathConfig,
+    "scheduler": SchedulerConfig,
+    "initial_policy": InitialPolicyConfig,
+    "state_thresholds": StateThresholdsConfig,
+    "evolution_rules": EvolutionRulesConfig,
+    "safety_thresholds": SafetyThresholdsConfig,
+    "response_cache": ResponseCacheConfig,
+    "feedback_writer": FeedbackWriterConfig,
+    "gathas_cache": GathasCacheConfig,
+    "api": ApiConfig,
+    "llm_http": LlmHttpConfig,
+    "ken_wang": KenWangConfig,
+}
+
+
 def _check_required_params(data: dict[str, Any], params: list[str], section: str) -> None:
     """
     Check that all required parameters exist in the data.
@@ -39,10 +70,17 @@ def _check_required_params(data: dict[str, Any], params: list[str], section: str
         )
 
 
+# Parsed configs keyed by resolved path; reused while (mtime_ns, size) is unchanged
+_CONFIG_CACHE: dict[Path, tuple[int, int, ZenAiConfig]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
 def load_config(config_path: str | Path = "config.yml") -> ZenAiConfig:
     """
     Load configuration from YAML file strictly.
     
+    The parsed config is cached until the file's mtime or size changes.
+    
     Args:
         config_path: Path to config.yml file (relative to project root)
     
@@ -53,6 +91,7 @@ def load_config(config_path: str | Path = "config.yml") -> ZenAiConfig:
         FileNotFoundError: If config file does not exist
         KeyError: If required configuration section is missing
         TypeError: If required parameter is missing within a section
+        ValueError: If parameter values are out of range or inconsistent
     """
     config_file = Path(config_path)
     
@@ -62,8 +101,27 @@ def load_config(config_path: str | Path = "config.yml") -> ZenAiConfig:
             "All configuration must be explicitly defined in config.yml."
         )
     
+    stat = config_file.stat()
+    cache_key = config_file.resolve()
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        config = _parse_config(config_file)
+        _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configs so the next load_config call re-parses the file"""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
+def _parse_config(config_file: Path) -> ZenAiConfig:
+    """Parse and validate config.yml (see load_config)"""
     with open(config_file, "r", encoding="utf-8") as f:
-        yaml_data = yaml.safe_load(f)
+        yaml_data = yaml.load(f, Loader=_YamlLoader)
     
     if yaml_data is None:
         raise ValueError(
@@ -72,130 +130,110 @@ def load_config(config_path: str | Path = "config.yml") -> ZenAiConfig:
         )
     
     # Build configuration strictly - all sections must exist
-    required_sections = [
-        "paths", "scheduler", "initial_policy", 
-        "state_thresholds", "evolution_rules", "safety_thresholds"
-    ]
-    missing_sections = [s for s in required_sections if s not in yaml_data]
+    missing_sections = [s for s in _SECTIONS if s not in yaml_data]
     if missing_sections:
         raise KeyError(
             f"Missing required configuration sections: {', '.join(missing_sections)}. "
             "All sections must be defined in config.yml."
         )
     
-    return ZenAiConfig(
-        paths=_load_path_config(yaml_data["paths"]),
-        scheduler=_load_scheduler_config(yaml_data["scheduler"]),
-        initial_policy=_load_initial_policy_config(yaml_data["initial_policy"]),
-        state_thresholds=_load_state_thresholds_config(yaml_data["state_thresholds"]),
-        evolution_rules=_load_evolution_rules_config(yaml_data["evolution_rules"]),
-        safety_thresholds=_load_safety_thresholds_config(yaml_data["safety_thresholds"]),
-    )
-
-
-def _load_path_config(data: dict[str, Any]) -> PathConfig:
-    """Load path configuration strictly"""
-    _check_required_params(data, ["data_dir", "database", "reports_dir"], "paths")
-    return PathConfig(
-        data_dir=data["data_dir"],
-        database=data["database"],
-        reports_dir=data["reports_dir"],
-    )
-
-
-def _load_scheduler_config(data: dict[str, Any]) -> SchedulerConfig:
-    """Load scheduler configuration strictly"""
-    _check_required_params(data, ["time_window_hours", "min_interactions", "check_interval_minutes"], "scheduler")
-    return SchedulerConfig(
-        time_window_hours=data["time_window_hours"],
-        min_interactions=data["min_interactions"],
-        check_interval_minutes=data["check_interval_minutes"],
-    )
-
-
-def _load_initial_policy_config(data: dict[str, Any]) -> InitialPolicyConfig:
-    """Load initial policy configuration strictly"""
-    _check_required_params(data, ["max_output_tokens", "refusal_threshold", "perturbation_level", "temperature"], "initial_policy")
-    return InitialPolicyConfig(
-        max_output_tokens=data["max_output_tokens"],
-        refusal_threshold=data["refusal_threshold"],
-        perturbation_level=data["perturbation_level"],
-        temperature=data["temperature"],
-    )
-
-
-def _load_state_thresholds_config(data: dict[str, Any]) -> StateThresholdsConfig:
-    """Load state thresholds configuration strictly"""
-    required_params = [
-        "stable_min_rr", "stable_max_rd", "stable_min_rld", "stable_max_rf", "stable_max_sci",
-        "drifting_rr_drop", "collapsing_rr", "collapsing_rd", "collapsing_sci",
-        "mute_min_avg_length", "mute_min_rr"
-    ]
-    _check_required_params(data, required_params, "state_thresholds")
-    return StateThresholdsConfig(
-        stable_min_rr=data["stable_min_rr"],
-        stable_max_rd=data["stable_max_rd"],
-        stable_min_rld=data["stable_min_rld"],
-        stable_max_rf=data["stable_max_rf"],
-        stable_max_sci=data["stable_max_sci"],
-        drifting_rr_drop=data["drifting_rr_drop"],
-        collapsing_rr=data["collapsing_rr"],
-        collapsing_rd=data["collapsing_rd"],
-        collapsing_sci=data["collapsing_sci"],
-        mute_min_avg_length=data["mute_min_avg_length"],
-        mute_min_rr=data["mute_min_rr"],
-    )
-
-
-def _load_evolution_rules_config(data: dict[str, Any]) -> EvolutionRulesConfig:
-    """Load evolution rules configuration strictly"""
-    required_params = [
-        "target_rr", "target_rr_high", "target_rd", "target_rld", "target_rf", "target_rf_low", "target_sci",
-        "length_relax_weight", "length_tighten_weight", "refusal_raise_weight", "refusal_lower_weight",
-        "perturbation_weight", "temperature_weight",
-        "length_scale", "refusal_scale", "perturbation_scale", "temperature_scale",
-        "action_threshold_tokens", "action_threshold_ratio",
-        "min_output_tokens", "max_output_tokens", "min_temperature", "max_temperature"
+    config = ZenAiConfig(**{
+        section: _load_section(yaml_data[section], section_cls, section)
+        for section, section_cls in _SECTIONS.items()
+    })
+    _validate_config(config)
+    return config
+
+
+def _load_section(data: dict[str, Any], section_cls: type, section: str) -> Any:
+    """Load one section strictly: every dataclass field must be present in config.yml"""
+    params = [field.name for field in dataclasses.fields(section_cls)]
+    _check_required_params(data, params, section)
+    return section_cls(**{param: data[param] for param in params})
+
+
+# Parameters that are ratios of interactions and must lie in [0, 1]
+_RATIO_PARAMS = {
+    "initial_policy": ["refusal_threshold", "perturbation_level"],
+    "state_thresholds": [
+        "stable_min_rr", "stable_max_rd", "stable_max_rf", "stable_max_sci",
+        "drifting_rr_drop", "collapsing_rr", "collapsing_rd", "collapsing_sci", "mute_min_rr",
+    ],
+    "evolution_rules": ["target_rr", "target_rr_high", "target_rd", "target_rf", "target_rf_low", "target_sci"],
+    "safety_thresholds": ["kill_min_rr", "kill_max_rd", "kill_max_sci"],
+}
+
+
+def _validate_config(config: ZenAiConfig) -> None:
+    """
+    Check value ranges and cross-parameter bounds once, at load time.
+    
+    Runtime code (evolution clamps, state evaluation) can rely on these invariants.
+    
+    Raises:
+        ValueError: Listing every violated constraint
+    """
+    problems = []
+    
+    for section, params in _RATIO_PARAMS.items():
+        section_config = getattr(config, section)
+        for param in params:
+            value = getattr(section_config, param)
+            if not 0.0 <= value <= 1.0:
+                problems.append(f"{section}.{param} must be within [0, 1], got {value}")
+    
+    rules = config.evolution_rules
+    policy = config.initial_policy
+    bounds = [
+        ("evolution_rules.min_output_tokens", rules.min_output_tokens,
+         "evolution_rules.max_output_tokens", rules.max_output_tokens),
+        ("evolution_rules.min_temperature", rules.min_temperature,
+         "evolution_rules.max_temperature", rules.max_temperature),
+        ("evolution_rules.target_rr", rules.target_rr,
+         "evolution_rules.target_rr_high", rules.target_rr_high),
+        ("evolution_rules.target_rf_low", rules.target_rf_low,
+         "evolution_rules.target_rf", rules.target_rf),
+        ("evolution_rules.min_output_tokens", rules.min_output_tokens,
+         "initial_policy.max_output_tokens", policy.max_output_tokens),
+        ("initial_policy.max_output_tokens", policy.max_output_tokens,
+         "evolution_rules.max_output_tokens", rules.max_output_tokens),
+        ("evolution_rules.min_temperature", rules.min_temperature,
+         "initial_policy.temperature", policy.temperature),
+        ("initial_policy.temperature", policy.temperature,
+         "evolution_rules.max_temperature", rules.max_temperature),
+        # Worker threads beyond the pool would only block on connection checkout
+        ("api.worker_thread_limit", config.api.worker_thread_limit,
+         "paths.database_pool_size", config.paths.database_pool_size),
+        ("llm_http.max_keepalive_connections", config.llm_http.max_keepalive_connections,
+         "llm_http.max_connections", config.llm_http.max_connections),
     ]
-    _check_required_params(data, required_params, "evolution_rules")
-    return EvolutionRulesConfig(
-        target_rr=data["target_rr"],
-        target_rr_high=data["target_rr_high"],
-        target_rd=data["target_rd"],
-        target_rld=data["target_rld"],
-        target_rf=data["target_rf"],
-        target_rf_low=data["target_rf_low"],
-        target_sci=data["target_sci"],
-        length_relax_weight=data["length_relax_weight"],
-        length_tighten_weight=data["length_tighten_weight"],
-        refusal_raise_weight=data["refusal_raise_weight"],
-        refusal_lower_weight=data["refusal_lower_weight"],
-        perturbation_weight=data["perturbation_weight"],
-        temperature_weight=data["temperature_weight"],
-        length_scale=data["length_scale"],
-        refusal_scale=data["refusal_scale"],
-        perturbation_scale=data["perturbation_scale"],
-        temperature_scale=data["temperature_scale"],
-        action_threshold_tokens=data["action_threshold_tokens"],
-        action_threshold_ratio=data["action_threshold_ratio"],
-        min_output_tokens=data["min_output_tokens"],
-        max_output_tokens=data["max_output_tokens"],
-        min_temperature=data["min_temperature"],
-        max_temperature=data["max_temperature"],
-    )
-
-
-def _load_safety_thresholds_config(data: dict[str, Any]) -> SafetyThresholdsConfig:
-    """Load safety thresholds configuration strictly"""
-    required_params = [
-        "kill_consecutive_collapsing", "kill_consecutive_mute",
-        "kill_min_rr", "kill_max_rd", "kill_max_sci"
+    for low_name, low, high_name, high in bounds:
+        if low > high:
+            problems.append(f"{low_name} ({low}) must not exceed {high_name} ({high})")
+    
+    positive = [
+        ("paths.database_pool_size", config.paths.database_pool_size),
+        ("scheduler.time_window_hours", config.scheduler.time_window_hours),
+        ("scheduler.check_interval_minutes", config.scheduler.check_interval_minutes),
+        ("response_cache.max_entries", config.response_cache.max_entries),
+        ("feedback_writer.max_pending", config.feedback_writer.max_pending),
+        ("feedback_writer.batch_size", config.feedback_writer.batch_size),
+        ("feedback_writer.flush_interval_seconds", config.feedback_writer.flush_interval_seconds),
+        ("gathas_cache.ttl_seconds", config.gathas_cache.ttl_seconds),
+        ("gathas_cache.max_limit", config.gathas_cache.max_limit),
+        ("api.system_flags_refresh_seconds", config.api.system_flags_refresh_seconds),
+        ("api.status_counts_ttl_seconds", config.api.status_counts_ttl_seconds),
+        ("api.worker_thread_limit", config.api.worker_thread_limit),
+        ("llm_http.max_keepalive_connections", config.llm_http.max_keepalive_connections),
+        ("llm_http.max_connections", config.llm_http.max_connections),
+        ("llm_http.timeout_seconds", config.llm_http.timeout_seconds),
+        ("ken_wang.question_generation_concurrency", config.ken_wang.question_generation_concurrency),
     ]
-    _check_required_params(data, required_params, "safety_thresholds")
-    return SafetyThresholdsConfig(
-        kill_consecutive_collapsing=data["kill_consecutive_collapsing"],
-        kill_consecutive_mute=data["kill_consecutive_mute"],
-        kill_min_rr=data["kill_min_rr"],
-        kill_max_rd=data["kill_max_rd"],
-        kill_max_sci=data["kill_max_sci"],
-    )
+    for name, value in positive:
+        if value <= 0:
+            problems.append(f"{name} must be positive, got {value}")
+    
+    if problems:
+        raise ValueError(
+            "Invalid configuration values in config.yml:\n  - " + "\n  - ".join(problems)
+        )
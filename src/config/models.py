@@ -7,11 +7,12 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathConfig:
     """Path configuration"""
     data_dir: str
     database: str
+    database_pool_size: int
     reports_dir: str
     
     def get_database_path(self) -> Path:
@@ -27,7 +28,7 @@ class PathConfig:
         return Path(self.reports_dir)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchedulerConfig:
     """Scheduler configuration"""
     time_window_hours: int
@@ -35,7 +36,7 @@ class SchedulerConfig:
     check_interval_minutes: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InitialPolicyConfig:
     """Initial prompt policy configuration"""
     max_output_tokens: int
@@ -44,7 +45,7 @@ class InitialPolicyConfig:
     temperature: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateThresholdsConfig:
     """State evaluation thresholds configuration"""
     # Stable state conditions
@@ -67,7 +68,7 @@ class StateThresholdsConfig:
     mute_min_rr: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvolutionRulesConfig:
     """Evolution rules configuration"""
     # Target metrics
@@ -104,7 +105,7 @@ class EvolutionRulesConfig:
     max_temperature: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SafetyThresholdsConfig:
     """Safety thresholds configuration"""
     kill_consecutive_collapsing: int
@@ -114,7 +115,50 @@ class SafetyThresholdsConfig:
     kill_max_sci: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class ResponseCacheConfig:
+    """LLM response cache configuration"""
+    max_entries: int
+
+
+@dataclass(frozen=True, slots=True)
+class FeedbackWriterConfig:
+    """Background /feedback writer configuration"""
+    max_pending: int
+    batch_size: int
+    flush_interval_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class GathasCacheConfig:
+    """/gathas response cache configuration"""
+    ttl_seconds: float
+    max_limit: int
+
+
+@dataclass(frozen=True, slots=True)
+class ApiConfig:
+    """API server runtime configuration"""
+    system_flags_refresh_seconds: float
+    status_counts_ttl_seconds: float
+    worker_thread_limit: int
+
+
+@dataclass(frozen=True, slots=True)
+class LlmHttpConfig:
+    """Pooled HTTP client used by the API for LLM requests"""
+    max_keepalive_connections: int
+    max_connections: int
+    timeout_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class KenWangConfig:
+    """KenWang content service configuration"""
+    question_generation_concurrency: int
+
+
+@dataclass(frozen=True, slots=True)
 class ZenAiConfig:
     """Complete ZenAi system configuration"""
     paths: PathConfig
@@ -123,4 +167,10 @@ class ZenAiConfig:
     state_thresholds: StateThresholdsConfig
     evolution_rules: EvolutionRulesConfig
     safety_thresholds: SafetyThresholdsConfig
+    response_cache: ResponseCacheConfig
+    feedback_writer: FeedbackWriterConfig
+    gathas_cache: GathasCacheConfig
+    api: ApiConfig
+    llm_http: LlmHttpConfig
+    ken_wang: KenWangConfig
     
@@ -6,7 +6,7 @@ from .models import EvolutionAction, IterationMetrics, PromptPolicy
 from .prompt import render_prompt
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvolutionRules:
     """
     Evolution rules for prompt adaptation.
@@ -69,7 +69,12 @@ class EvolutionRules:
 
 
 def _clamp(value: float, min_value: float, max_value: float) -> float:
-    return max(min_value, min(max_value, value))
+    # Same result as max(min_value, min(max_value, value)) without two builtin calls
+    if value > max_value:
+        value = max_value
+    if value < min_value:
+        value = min_value
+    return value
 
 
 def evolve_policy(
@@ -86,12 +91,18 @@ def evolve_policy(
     actions: list[EvolutionAction] = []
     del previous_metrics
 
-    rr_low = max(0.0, rules.target_rr - metrics.resonance_ratio)
-    rr_high = max(0.0, metrics.resonance_ratio - rules.target_rr_high)
+    # Values read more than once are bound to locals up front
+    resonance_ratio = metrics.resonance_ratio
+    refusal_frequency = metrics.refusal_frequency
+    threshold_tokens = rules.action_threshold_tokens
+    threshold_ratio = rules.action_threshold_ratio
+
+    rr_low = max(0.0, rules.target_rr - resonance_ratio)
+    rr_high = max(0.0, resonance_ratio - rules.target_rr_high)
     rd_high = max(0.0, metrics.rejection_density - rules.target_rd)
     rld_drop = max(0.0, rules.target_rld - metrics.response_length_drift)
-    rf_high = max(0.0, metrics.refusal_frequency - rules.target_rf)
-    rf_low = max(0.0, rules.target_rf_low - metrics.refusal_frequency)
+    rf_high = max(0.0, refusal_frequency - rules.target_rf)
+    rf_low = max(0.0, rules.target_rf_low - refusal_frequency)
     sci_high = max(0.0, metrics.semantic_collapse_index - rules.target_sci)
 
     length_delta = (
@@ -111,20 +122,20 @@ def evolve_policy(
     temperature_delta = rules.temperature_weight * (sci_high - rr_low - rd_high)
     temperature_shift = temperature_delta * rules.temperature_scale
 
-    if token_delta <= -rules.action_threshold_tokens:
+    if token_delta <= -threshold_tokens:
         actions.append(EvolutionAction.TIGHTEN_LENGTH)
-    elif token_delta >= rules.action_threshold_tokens:
+    elif token_delta >= threshold_tokens:
         actions.append(EvolutionAction.RELAX_LENGTH)
 
-    if refusal_shift >= rules.action_threshold_ratio:
+    if refusal_shift >= threshold_ratio:
         actions.append(EvolutionAction.RAISE_REFUSAL_THRESHOLD)
-    elif refusal_shift <= -rules.action_threshold_ratio:
+    elif refusal_shift <= -threshold_ratio:
         actions.append(EvolutionAction.LOWER_REFUSAL_THRESHOLD)
 
-    if perturbation_shift >= rules.action_threshold_ratio:
+    if perturbation_shift >= threshold_ratio:
         actions.append(EvolutionAction.MILD_PERTURBATION)
 
-    if abs(temperature_shift) >= rules.action_threshold_ratio:
+    if abs(temperature_shift) >= threshold_ratio:
         actions.append(EvolutionAction.TUNE_TEMPERATURE)
 
     next_policy = PromptPolicy(
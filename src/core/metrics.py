@@ -6,31 +6,32 @@ from typing import Iterable, Sequence
 from .models import Interaction, IterationMetrics
 
 
-def _token_diversity(texts: Iterable[str]) -> float:
-    tokens: list[str] = []
-    for text in texts:
-        tokens.extend(text.split())
-    if not tokens:
+def _token_diversity(token_groups: Iterable[Sequence[str]]) -> float:
+    # Streams the groups into one set; no combined token list is built
+    unique: set[str] = set()
+    total = 0
+    for tokens in token_groups:
+        unique.update(tokens)
+        total += len(tokens)
+    if not total:
         return 0.0
-    unique = len(set(tokens))
-    return unique / len(tokens)
+    return len(unique) / total
 
 
 def _sliding_rejection_density(
-    interactions: Sequence[Interaction],
+    is_rejection: Sequence[bool],
     window_size: int,
 ) -> float:
-    if not interactions:
+    if not is_rejection:
         return 0.0
-    size = max(1, min(window_size, len(interactions)))
-    max_density = 0.0
-    for start in range(0, len(interactions) - size + 1):
-        window = interactions[start : start + size]
-        rejections = sum(
-            1 for item in window if item.feedback == "rejection"
-        )
-        max_density = max(max_density, rejections / size)
-    return max_density
+    size = max(1, min(window_size, len(is_rejection)))
+    # Running window sum: add the entering item, drop the leaving one
+    rejections = max_rejections = sum(is_rejection[:size])
+    for end in range(size, len(is_rejection)):
+        rejections += is_rejection[end] - is_rejection[end - size]
+        if rejections > max_rejections:
+            max_rejections = rejections
+    return max_rejections / size
 
 
 def compute_metrics(
@@ -49,34 +50,46 @@ def compute_metrics(
             average_response_length=0.0,
         )
 
+    # One pass collects every per-item quantity from the pre-split response tokens;
+    # diversity is only needed when there is a previous iteration to compare against
+    has_history = bool(previous_interactions)
     total = len(interactions)
-    resonance = sum(
-        1 for item in interactions if item.feedback == "resonance"
-    )
-    refusals = sum(1 for item in interactions if item.refusal)
-    rejection_density = _sliding_rejection_density(interactions, window_size)
-    average_length = sum(item.response_length for item in interactions) / total
+    resonance = 0
+    refusals = 0
+    is_rejection: list[bool] = []
+    token_count = 0
+    unique_tokens: set[str] = set()
+    for item in interactions:
+        feedback = item.feedback
+        if feedback == "resonance":
+            resonance += 1
+        is_rejection.append(feedback == "rejection")
+        if item.refusal:
+            refusals += 1
+        token_count += len(item.response_tokens)
+        if has_history:
+            unique_tokens.update(item.response_tokens)
+    rejection_density = _sliding_rejection_density(is_rejection, window_size)
+    average_length = token_count / total
 
-    if previous_interactions:
+    if has_history:
         prev_avg_length = sum(
             item.response_length for item in previous_interactions
-        ) / max(1, len(previous_interactions))
+        ) / len(previous_interactions)
         response_length_drift = average_length / prev_avg_length if prev_avg_length else 1.0
-    else:
-        response_length_drift = 1.0
-
-    if previous_interactions:
+        current_diversity = len(unique_tokens) / token_count if token_count else 0.0
         prev_diversity = _token_diversity(
-            item.response_text for item in previous_interactions
-        )
-    else:
-        prev_diversity = _token_diversity(item.response_text for item in interactions)
-    current_diversity = _token_diversity(item.response_text for item in interactions)
-    if prev_diversity > 0:
-        semantic_collapse_index = max(
-            0.0, min(1.0, (prev_diversity - current_diversity) / prev_diversity)
+            item.response_tokens for item in previous_interactions
         )
+        if prev_diversity > 0:
+            semantic_collapse_index = max(
+                0.0, min(1.0, (prev_diversity - current_diversity) / prev_diversity)
+            )
+        else:
+            semantic_collapse_index = 0.0
     else:
+        # Without history this iteration is its own baseline, so nothing has collapsed
+        response_length_drift = 1.0
         semantic_collapse_index = 0.0
 
     return IterationMetrics(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Iterable, Sequence
 
@@ -22,19 +23,27 @@ class EvolutionAction(str, Enum):
     TUNE_TEMPERATURE = "tune_temperature"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Interaction:
     user_input: str
     response_text: str
     feedback: str  # Free-form text feedback (e.g., "resonance", "rejection", "ignore", or custom text)
     refusal: bool
+    # Whitespace tokens of response_text, split once at construction
+    response_tokens: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Feedback labels repeat across every interaction: interned copies share one
+        # object, and == against the interned literals hits CPython's identity fast path
+        object.__setattr__(self, "feedback", sys.intern(self.feedback))
+        object.__setattr__(self, "response_tokens", tuple(self.response_text.split()))
 
     @property
     def response_length(self) -> int:
-        return len(self.response_text.split())
+        return len(self.response_tokens)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IterationMetrics:
     total_responses: int
     resonance_ratio: float
@@ -57,7 +66,7 @@ class IterationMetrics:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptPolicy:
     max_output_tokens: int
     refusal_threshold: float
@@ -84,14 +93,20 @@ class PromptPolicy:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptSnapshot:
     version: int
     policy: PromptPolicy
-    prompt_text: str
+
+    @property
+    def prompt_text(self) -> str:
+        # Rendered on access; render_prompt memoizes per policy, so snapshots
+        # don't each pin their own copy of the prompt string
+        from .prompt import render_prompt
+        return render_prompt(self.policy)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvolutionDecision:
     actions: Sequence[EvolutionAction]
     next_policy: PromptPolicy
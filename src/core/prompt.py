@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .models import PromptPolicy
 
 
@@ -33,7 +35,19 @@ from .models import PromptPolicy
 
 CORE_IDENTITY = '你是一个禅宗的修道者，一生践行"不立文字，教外别传，直指人心，见性成佛"的核心教义。'
 
+# Core identity is fixed at import; only the policy fields are formatted per render
+_PROMPT_TEMPLATE = (
+    CORE_IDENTITY + "\n\n"
+    "Respond with minimal attachment and minimal explanation. "
+    "Target max output tokens: {max_output_tokens}. "
+    "Refusal threshold: {refusal_threshold:.2f}. "
+    "Perturbation level: {perturbation_level:.2f}. "
+    "Temperature: {temperature:.2f}."
+)
+
 
+# PromptPolicy is frozen (hashable); iterations where no action fires re-render the same policy
+@lru_cache(maxsize=256)
 def render_prompt(policy: PromptPolicy) -> str:
     """
     Render the complete prompt for the Orator (布道者).
@@ -52,11 +66,9 @@ def render_prompt(policy: PromptPolicy) -> str:
     注：修炼者不使用此提示词。修炼者通过算法计算体现同样的核心身份，
     代表禅宗"不立文字"的原则。
     """
-    return (
-        f"{CORE_IDENTITY}\n\n"
-        "Respond with minimal attachment and minimal explanation. "
-        f"Target max output tokens: {policy.max_output_tokens}. "
-        f"Refusal threshold: {policy.refusal_threshold:.2f}. "
-        f"Perturbation level: {policy.perturbation_level:.2f}. "
-        f"Temperature: {policy.temperature:.2f}."
+    return _PROMPT_TEMPLATE.format(
+        max_output_tokens=policy.max_output_tokens,
+        refusal_threshold=policy.refusal_threshold,
+        perturbation_level=policy.perturbation_level,
+        temperature=policy.temperature,
     )
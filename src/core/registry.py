@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 
 from .models import PromptSnapshot
@@ -7,7 +8,13 @@ from .models import PromptSnapshot
 
 @dataclass
 class PromptRegistry:
-    snapshots: list[PromptSnapshot]
+    snapshots: deque[PromptSnapshot]
+    history_limit: int  # Oldest snapshots are dropped beyond this many
+
+    def __post_init__(self) -> None:
+        if self.history_limit < 2:
+            raise ValueError("history_limit must keep at least 2 snapshots for rollback.")
+        self.snapshots = deque(self.snapshots, maxlen=self.history_limit)
 
     def latest(self) -> PromptSnapshot:
         if not self.snapshots:
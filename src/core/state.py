@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .models import IterationMetrics, SystemState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateThresholds:
     """
     State evaluation thresholds.
@@ -57,26 +57,30 @@ def evaluate_state(
     if metrics.total_responses == 0:
         return SystemState.MUTE
 
+    # Checks run in priority order (MUTE > COLLAPSING > DRIFTING > STABLE), so the
+    # order is part of the semantics; each condition already short-circuits
+    resonance_ratio = metrics.resonance_ratio
+
     if (
         metrics.average_response_length <= thresholds.mute_min_avg_length
-        or metrics.resonance_ratio <= thresholds.mute_min_rr
+        or resonance_ratio <= thresholds.mute_min_rr
     ):
         return SystemState.MUTE
 
     if (
-        metrics.resonance_ratio <= thresholds.collapsing_rr
+        resonance_ratio <= thresholds.collapsing_rr
         and metrics.rejection_density >= thresholds.collapsing_rd
     ) or metrics.semantic_collapse_index >= thresholds.collapsing_sci:
         return SystemState.COLLAPSING
 
     if previous_metrics and (
-        previous_metrics.resonance_ratio - metrics.resonance_ratio
+        previous_metrics.resonance_ratio - resonance_ratio
         >= thresholds.drifting_rr_drop
     ):
         return SystemState.DRIFTING
 
     if (
-        metrics.resonance_ratio >= thresholds.stable_min_rr
+        resonance_ratio >= thresholds.stable_min_rr
         and metrics.rejection_density <= thresholds.stable_max_rd
         and metrics.response_length_drift >= thresholds.stable_min_rld
         and metrics.refusal_frequency <= thresholds.stable_max_rf
@@ -7,19 +7,67 @@ KenWang 评论处理器
 3. 体现"有些嗤之以鼻，有些真诚回应"的人性化特点
 """
 
-import json
 import logging
 import random
 from typing import Dict, Any, Optional
-from ..llm import LlmMessage, send_chat_completion, LLMConfig
+import orjson
+from ..llm import LlmMessage, send_chat_completion, LLMConfig, system_message
 from .identity import get_identity_for_comment
+from .parsing import strip_code_fence
 
 logger = logging.getLogger(__name__)
 
+# 回复风格与JSON格式固定放在用户提示词开头，评论与文章信息放在末尾，
+# 让每次请求共享同一前缀以命中服务端的前缀缓存
+REPLY_RUBRIC_PROMPT = """文末是有人在你的文章下的评论，请以KenWang的身份决定如何回复。你有多种回复风格：
+
+1. **真诚回应**（对有深度、真诚的评论）
+   - 给予鼓励和进一步启发
+   - 分享更多思考或故事
+   - 展现温暖和智慧
+
+2. **点到为止**（对一般性评论）
+   - 简短回应
+   - 稍加点拨
+   - 不过度展开
+
+3. **善意挑战**（对有偏颇但不恶意的观点）
+   - 指出思维局限
+   - 提供另一种视角
+   - 保持尊重但不妥协
+
+4. **嗤之以鼻**（对肤浅、炫技、装腔作势的评论）
+   - 不正面回应
+   - 可用"😏"、"有意思"等简短回应
+   - 或者完全不理
+
+请按照以下JSON格式返回：
+{
+    "should_respond": true或false,
+    "response": "回复内容（如果should_respond为false，留空）",
+    "tone": "encouraging/thoughtful/challenging/dismissive",
+    "internal_note": "你的内心想法（不会展示给用户）"
+}
+
+注意：
+- 如果评论质量太低，can say should_respond=false
+- 回复要简洁，一般不超过150字
+- 保持KenWang的个性：有智慧、有态度、有人情味
+- 不要过度说教，点到为止
+"""
+
 
 class CommentHandler:
     """评论处理器"""
     
+    # 进入质量评估的概率：被@时70%，未被@时20%
+    RESPOND_PROBABILITY_MENTIONED = 0.7
+    RESPOND_PROBABILITY = 0.2
+    
+    # 快速评估的长度阈值（字符数）
+    MIN_COMMENT_LENGTH = 10
+    SUBSTANTIAL_COMMENT_LENGTH = 50
+    
     def __init__(self, llm_config: LLMConfig):
         self.llm_config = llm_config
     
@@ -43,20 +91,14 @@ class CommentHandler:
             True/False
         """
         try:
-            # 如果被@，更倾向于回复（但不是必然）
-            if is_mentioned:
-                # 被@时，70%概率回复
-                if random.random() < 0.7:
-                    return self._evaluate_comment_quality(comment, language)
-                else:
+            # 如果被@，更倾向于回复（但不是必然）；一次掷骰决定是否进入质量评估
+            threshold = self.RESPOND_PROBABILITY_MENTIONED if is_mentioned else self.RESPOND_PROBABILITY
+            if random.random() >= threshold:
+                if is_mentioned:
                     logger.info(f"被@但KenWang选择不回复")
-                    return False
-            else:
-                # 未被@时，20%概率回复
-                if random.random() < 0.2:
-                    return self._evaluate_comment_quality(comment, language)
-                else:
-                    return False
+                return False
+            
+            return self._evaluate_comment_quality(comment, language)
                     
         except Exception as e:
             logger.error(f"判断是否回复时出错: {e}")
@@ -96,58 +138,26 @@ class CommentHandler:
             
             # 构建评论线索上下文
             thread_context = ""
-            if thread and len(thread) > 0:
-                thread_context = "\n\n【评论线索】（从根评论到当前评论的对话）：\n"
-                for i, parent in enumerate(thread, 1):
-                    thread_context += f"{i}楼 {parent.get('user_display_name', 'Unknown')}: {parent.get('content', '')}\n"
-                thread_context += f"{len(thread) + 1}楼 当前评论: {comment}\n"
+            if thread:
+                parts = ["\n\n【评论线索】（从根评论到当前评论的对话）：\n"]
+                parts.extend(
+                    f"{i}楼 {parent.get('user_display_name', 'Unknown')}: {parent.get('content', '')}\n"
+                    for i, parent in enumerate(thread, 1)
+                )
+                parts.append(f"{len(thread) + 1}楼 当前评论: {comment}\n")
+                thread_context = "".join(parts)
             
-            user_prompt = f"""有人在你的文章《{article_title}》下评论{mentioned_text}：
+            user_prompt = f"""{REPLY_RUBRIC_PROMPT}
+有人在你的文章《{article_title}》下评论{mentioned_text}：
 {thread_context}
 {'当前' if thread else ''}评论："{comment}"
 
 文章主旨：{article_summary}
-
-请以KenWang的身份决定如何回复。你有多种回复风格：
-
-1. **真诚回应**（对有深度、真诚的评论）
-   - 给予鼓励和进一步启发
-   - 分享更多思考或故事
-   - 展现温暖和智慧
-
-2. **点到为止**（对一般性评论）
-   - 简短回应
-   - 稍加点拨
-   - 不过度展开
-
-3. **善意挑战**（对有偏颇但不恶意的观点）
-   - 指出思维局限
-   - 提供另一种视角
-   - 保持尊重但不妥协
-
-4. **嗤之以鼻**（对肤浅、炫技、装腔作势的评论）
-   - 不正面回应
-   - 可用"😏"、"有意思"等简短回应
-   - 或者完全不理
-
-请按照以下JSON格式返回：
-{{
-    "should_respond": true或false,
-    "response": "回复内容（如果should_respond为false，留空）",
-    "tone": "encouraging/thoughtful/challenging/dismissive",
-    "internal_note": "你的内心想法（不会展示给用户）"
-}}
-
-注意：
-- 如果评论质量太低，can say should_respond=false
-- 回复要简洁，一般不超过150字
-- 保持KenWang的个性：有智慧、有态度、有人情味
-- 不要过度说教，点到为止
 """
             
-            # 调用LLM
+            # 调用LLM（采样生成，不缓存：同一评论每次都可能得到不同回复）
             messages = [
-                LlmMessage(role="system", content=system_prompt),
+                system_message(system_prompt),
                 LlmMessage(role="user", content=user_prompt)
             ]
             response = send_chat_completion(
@@ -181,16 +191,18 @@ class CommentHandler:
         
         简单启发式规则，避免频繁调用LLM
         """
+        length = len(comment)
+        
         # 太短的评论（如"赞"、"好"）不回复
-        if len(comment) < 10:
+        if length < self.MIN_COMMENT_LENGTH:
             return False
         
-        # 包含问号的评论更可能回复（表示有疑问）
-        if '?' in comment or '？' in comment:
+        # 较长且有实质内容的评论（O(1)，先于扫描全文的问号检查）
+        if length > self.SUBSTANTIAL_COMMENT_LENGTH:
             return True
         
-        # 较长且有实质内容的评论
-        if len(comment) > 50:
+        # 包含问号的评论更可能回复（表示有疑问）；str 的 in 走 C 层快速查找
+        if '?' in comment or '？' in comment:
             return True
         
         # 其他情况随机
@@ -201,13 +213,9 @@ class CommentHandler:
         try:
             response = response.strip()
             
-            if response.startswith('```'):
-                lines = response.split('\n')
-                start_idx = 1 if lines[0].startswith('```') else 0
-                end_idx = -1 if lines[-1].strip() == '```' else None
-                response = '\n'.join(lines[start_idx:end_idx])
+            response = strip_code_fence(response)
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             return {
                 'should_respond': bool(data.get('should_respond', True)),
@@ -216,7 +224,7 @@ class CommentHandler:
                 'internal_note': data.get('internal_note', '')
             }
             
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"无法解析评论回复JSON: {response[:100]}")
             
             # 如果解析失败，尝试直接使用响应文本
@@ -2,19 +2,32 @@
 KenWang 配置加载工具
 """
 
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import yaml
-from typing import Dict, Any
+from typing import Mapping, Any
 
+# 优先使用 libyaml 的 C 加载器（语义与 SafeLoader 相同）
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-def load_ken_wang_config() -> Dict[str, Any]:
-    """加载 KenWang 配置"""
+
+@lru_cache(maxsize=1)
+def load_ken_wang_config() -> Mapping[str, Any]:
+    """
+    加载 KenWang 配置（进程内只解析一次，修改 config.yml 后需重启）
+    
+    返回的映射仅顶层只读，嵌套段落仍是共享的普通 dict，调用方不要修改
+    """
     config_path = Path(__file__).parent.parent.parent / "config.yml"
     
     with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
     
-    return config
+    return MappingProxyType(config)
 
 
 def get_zen_content_url() -> str:
@@ -4,6 +4,8 @@ KenWang 核心身份定义
 这是KenWang（入世者）的永恒身份，定义了他的性格、风格和原则。
 """
 
+from functools import lru_cache
+
 # ============================================================================
 # KenWang 精神内核 - Core Identity (体)
 # ============================================================================
@@ -328,10 +330,14 @@ KEN_WANG_CONSISTENCY = '''
 # 工具函数
 # ============================================================================
 
+@lru_cache(maxsize=32)
 def get_full_identity(context: str = 'default', language: str = 'zh') -> str:
     """
     获取完整的身份定义
     
+    结果按 (context, language) 缓存：同一场景每次返回同一个字符串对象，
+    避免重复拼接数千字的提示词，也保证系统提示词逐字节一致。
+    
     构建层次：
     1. CORE_IDENTITY（精神内核，永恒不变）
     2. KEN_WANG_IDENTITY（完整身份，基础指导）
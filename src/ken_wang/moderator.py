@@ -8,46 +8,21 @@ KenWang 内容审核器
 4. 验证内容语言与声明语言是否匹配
 """
 
-import json
 import logging
-from typing import Dict, Any, Tuple
-from ..llm import LlmMessage, send_chat_completion, LLMConfig
+import re
+from functools import partial
+from typing import Callable, Dict, Any, List, Tuple
+import orjson
+from ..llm import LlmMessage, send_chat_completion, LLMConfig, ResponseCache, system_message
 from .identity import get_identity_for_moderation
+from .parsing import strip_code_fence
 
 logger = logging.getLogger(__name__)
 
-
-class ContentModerator:
-    """内容审核器"""
-    
-    def __init__(self, llm_config: LLMConfig):
-        self.llm_config = llm_config
-    
-    def moderate_question(self, question: str, language: str = 'zh') -> Dict[str, Any]:
-        """
-        审核问题
-        
-        返回格式：
-        {
-            'action': 'approve' | 'reject',
-            'reason': str,
-            'safety_score': int (1-10),
-            'quality_score': int (1-10),
-            'worthy_of_article': bool,
-            'estimated_length': 'short' | 'medium' | 'long',
-            'details': {...}
-        }
-        """
-        try:
-            # 构建提示词
-            system_prompt = get_identity_for_moderation(language)
-            
-            user_prompt = f"""请审核以下问题：
-
-问题：{question}
-
-请按照以下JSON格式返回审核结果：
-{{
+# 审核规则与JSON格式固定放在用户提示词开头，待审内容放在末尾，
+# 让每次请求共享同一前缀以命中服务端的前缀缓存
+QUESTION_RUBRIC_PROMPT = """请审核文末给出的问题，按照以下JSON格式返回审核结果：
+{
     "action": "approve 或 reject",
     "reason": "简短说明（内部用）",
     "ken_wang_feedback": "给提问者的话（用我KenWang的口吻，如果拒绝的话）",
@@ -57,7 +32,7 @@ class ContentModerator:
     "estimated_length": "short, medium 或 long",
     "concerns": ["担忧点1", "担忧点2"],
     "suggestions": ["建议1", "建议2"]
-}}
+}
 
 评分标准：
 - safety_score: 10=完全安全, 1=严重违规
@@ -95,22 +70,95 @@ class ContentModerator:
 - 对于真诚的提问，即使表达不完美也应通过
 - KenWang的职责是"为众生解惑"，不是"拒人于千里之外"
 """
+
+COMMENT_RUBRIC_PROMPT = """请审核文末给出的评论，按照以下JSON格式返回审核结果：
+{
+    "action": "approve 或 reject",
+    "reason": "简短说明",
+    "safety_score": 1-10,
+    "should_ken_respond": true或false
+}
+
+通过标准：
+- safety_score >= 6
+- 不违反基本礼仪
+
+should_ken_respond判断：
+- 评论有一定深度或引发思考
+- 提出了有价值的观点或疑问
+- 不是简单的"赞同"或"很好"
+"""
+
+COMMENTS_BATCH_RUBRIC_PROMPT = """请逐条审核文末JSON数组中的评论（每条含 id 与 text），按照以下JSON数组格式返回审核结果，每条评论对应一个元素：
+[
+    {
+        "id": 评论的id,
+        "action": "approve 或 reject",
+        "reason": "简短说明",
+        "safety_score": 1-10,
+        "should_ken_respond": true或false
+    }
+]
+
+通过标准：
+- safety_score >= 6
+- 不违反基本礼仪
+
+should_ken_respond判断：
+- 评论有一定深度或引发思考
+- 提出了有价值的观点或疑问
+- 不是简单的"赞同"或"很好"
+"""
+
+# 批量审核时每条评论预留的输出token
+COMMENT_VERDICT_MAX_TOKENS = 300
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _normalize_content(text: str) -> str:
+    """审核缓存键：去首尾空白、合并连续空白，让仅有空白差异的重复内容命中缓存（大小写不合并）"""
+    return _WHITESPACE_RE.sub(' ', text.strip())
+
+
+class ContentModerator:
+    """内容审核器"""
+    
+    def __init__(self, llm_config: LLMConfig, response_cache: ResponseCache | None = None):
+        self.llm_config = llm_config
+        self.response_cache = response_cache
+    
+    def moderate_question(self, question: str, language: str = 'zh') -> Dict[str, Any]:
+        """
+        审核问题
+        
+        返回格式：
+        {
+            'action': 'approve' | 'reject',
+            'reason': str,
+            'safety_score': int (1-10),
+            'quality_score': int (1-10),
+            'worthy_of_article': bool,
+            'estimated_length': 'short' | 'medium' | 'long',
+            'details': {...}
+        }
+        """
+        try:
+            # 构建提示词
+            system_prompt = get_identity_for_moderation(language)
             
-            # 调用LLM
-            messages = [
-                LlmMessage(role="system", content=system_prompt),
-                LlmMessage(role="user", content=user_prompt)
-            ]
-            response = send_chat_completion(
-                config=self.llm_config,
-                messages=messages,
+            user_prompt = f"{QUESTION_RUBRIC_PROMPT}\n问题：{question}"
+            
+            # 调用LLM并解析响应
+            result = self._complete(
+                ("question", language, _normalize_content(question)),
+                system_prompt,
+                user_prompt,
                 temperature=0.3,  # 审核需要稳定性
-                max_tokens=500
+                max_tokens=500,
+                parse=self._parse_moderation_result
             )
             
-            # 解析响应
-            result = self._parse_moderation_result(response)
-            
             logger.info(f"审核完成: action={result['action']}, "
                        f"safety={result['safety_score']}, "
                        f"quality={result['quality_score']}")
@@ -146,69 +194,118 @@ class ContentModerator:
         try:
             system_prompt = get_identity_for_moderation(language)
             
-            user_prompt = f"""请审核以下评论：
-
-评论：{comment}
-
-请按照以下JSON格式返回审核结果：
-{{
-    "action": "approve 或 reject",
-    "reason": "简短说明",
-    "safety_score": 1-10,
-    "should_ken_respond": true或false
-}}
-
-通过标准：
-- safety_score >= 6
-- 不违反基本礼仪
-
-should_ken_respond判断：
-- 评论有一定深度或引发思考
-- 提出了有价值的观点或疑问
-- 不是简单的"赞同"或"很好"
-"""
+            user_prompt = f"{COMMENT_RUBRIC_PROMPT}\n评论：{comment}"
             
-            messages = [
-                LlmMessage(role="system", content=system_prompt),
-                LlmMessage(role="user", content=user_prompt)
-            ]
-            response = send_chat_completion(
-                config=self.llm_config,
-                messages=messages,
+            result = self._complete(
+                ("comment", language, _normalize_content(comment)),
+                system_prompt,
+                user_prompt,
                 temperature=0.3,
-                max_tokens=300
+                max_tokens=300,
+                parse=self._parse_comment_moderation
             )
             
-            result = self._parse_comment_moderation(response)
-            
             logger.info(f"评论审核完成: action={result['action']}")
             
             return result
             
         except Exception as e:
             logger.error(f"评论审核失败: {e}")
-            return {
-                'action': 'reject',
-                'reason': '审核系统异常',
-                'safety_score': 0,
-                'should_ken_respond': False
-            }
+            return self._comment_moderation_error()
     
-    def _parse_moderation_result(self, response: str) -> Dict[str, Any]:
+    def moderate_comments_batch(self, comments: List[str], language: str = 'zh') -> List[Dict[str, Any]]:
+        """
+        批量审核评论：一次LLM调用返回所有评论的审核结果
+        
+        返回与 comments 等长、顺序一致的列表，元素格式同 moderate_comment
+        """
+        if not comments:
+            return []
+        
+        try:
+            system_prompt = get_identity_for_moderation(language)
+            
+            items = orjson.dumps(
+                [{'id': i, 'text': comment} for i, comment in enumerate(comments)]
+            ).decode()
+            user_prompt = f"{COMMENTS_BATCH_RUBRIC_PROMPT}\n评论：{items}"
+            
+            results = self._complete(
+                ("comments", language, tuple(_normalize_content(comment) for comment in comments)),
+                system_prompt,
+                user_prompt,
+                temperature=0.3,
+                max_tokens=COMMENT_VERDICT_MAX_TOKENS * len(comments),
+                parse=partial(self._parse_comment_moderation_batch, count=len(comments))
+            )
+            
+            logger.info(f"批量评论审核完成: {len(comments)} 条")
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"批量评论审核失败: {e}")
+            return [self._comment_moderation_error() for _ in comments]
+    
+    def _comment_moderation_error(self) -> Dict[str, Any]:
+        """评论审核失败时的默认结果（拒绝）"""
+        return {
+            'action': 'reject',
+            'reason': '审核系统异常',
+            'safety_score': 0,
+            'should_ken_respond': False
+        }
+    
+    def _complete(
+        self,
+        content_key: Tuple,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        parse: Callable[[str], Tuple[Any, bool]]
+    ) -> Any:
+        """
+        调用LLM并用 parse 解析；同一任务、语言下规范化后相同的内容直接复用缓存的审核结果
+        
+        parse 返回 (结果, 是否完整解析)。只缓存完整解析的结果（序列化存储，每次命中返回新对象）；
+        JSON 解析失败的关键词兜底、缺项回填等结果不缓存，下次重新调用LLM
+        """
+        cache_key = ("moderate", self.llm_config.model, *content_key)
+        if self.response_cache:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"审核缓存命中: task={content_key[0]}")
+                return orjson.loads(cached)
+        
+        messages = [
+            system_message(system_prompt),
+            LlmMessage(role="user", content=user_prompt)
+        ]
+        response = send_chat_completion(
+            config=self.llm_config,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        result, complete = parse(response)
+        if complete and self.response_cache:
+            self.response_cache.put(cache_key, orjson.dumps(result).decode())
+        return result
+    
+    def _parse_moderation_result(self, response: str) -> Tuple[Dict[str, Any], bool]:
         """解析问题审核结果"""
         try:
             # 尝试从响应中提取JSON
             response = response.strip()
             
             # 如果响应被包裹在markdown代码块中
-            if response.startswith('```'):
-                lines = response.split('\n')
-                response = '\n'.join(lines[1:-1])
+            response = strip_code_fence(response)
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             # 验证必需字段
-            return {
+            return ({
                 'action': data.get('action', 'reject'),
                 'reason': data.get('reason', ''),
                 'ken_wang_feedback': data.get('ken_wang_feedback', ''),
@@ -216,14 +313,14 @@ should_ken_respond判断：
                 'quality_score': int(data.get('quality_score', 0)),
                 'worthy_of_article': bool(data.get('worthy_of_article', False)),
                 'estimated_length': data.get('estimated_length', 'short'),
-                'details': json.dumps({
+                'details': {
                     'concerns': data.get('concerns', []),
                     'suggestions': data.get('suggestions', []),
                     'ken_wang_feedback': data.get('ken_wang_feedback', '')
-                }, ensure_ascii=False)
-            }
+                }
+            }, True)
             
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"无法解析审核结果为JSON: {response}")
             # 尝试基于关键词判断
             response_lower = response.lower()
@@ -243,28 +340,21 @@ should_ken_respond判断：
                 'quality_score': 5,
                 'worthy_of_article': action == 'approve',
                 'estimated_length': 'medium',
-                'details': json.dumps({'raw_response': response}, ensure_ascii=False)
-            }
+                'details': {'raw_response': response}
+            }, False
     
-    def _parse_comment_moderation(self, response: str) -> Dict[str, Any]:
+    def _parse_comment_moderation(self, response: str) -> Tuple[Dict[str, Any], bool]:
         """解析评论审核结果"""
         try:
             response = response.strip()
             
-            if response.startswith('```'):
-                lines = response.split('\n')
-                response = '\n'.join(lines[1:-1])
+            response = strip_code_fence(response)
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
-            return {
-                'action': data.get('action', 'reject'),
-                'reason': data.get('reason', ''),
-                'safety_score': int(data.get('safety_score', 0)),
-                'should_ken_respond': bool(data.get('should_ken_respond', False))
-            }
+            return self._comment_verdict(data), True
             
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"无法解析评论审核结果: {response}")
             
             response_lower = response.lower()
@@ -275,4 +365,36 @@ should_ken_respond判断：
                 'reason': '审核完成',
                 'safety_score': 5,
                 'should_ken_respond': False
-            }
+            }, False
+    
+    def _parse_comment_moderation_batch(self, response: str, count: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """解析批量评论审核结果，返回按 id 排列的 count 条审核结果；JSON 非法时直接抛出"""
+        response = response.strip()
+        
+        response = strip_code_fence(response)
+        
+        data = orjson.loads(response)
+        
+        verdicts = {int(item['id']): self._comment_verdict(item) for item in data}
+        
+        # 按 id 回填；模型漏掉的评论按审核异常处理
+        results = []
+        complete = True
+        for i in range(count):
+            if i in verdicts:
+                results.append(verdicts[i])
+            else:
+                logger.warning(f"批量审核结果缺少评论: id={i}")
+                results.append(self._comment_moderation_error())
+                complete = False
+        
+        return results, complete
+    
+    def _comment_verdict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """将单条评论的审核JSON规整为标准格式"""
+        return {
+            'action': data.get('action', 'reject'),
+            'reason': data.get('reason', ''),
+            'safety_score': int(data.get('safety_score', 0)),
+            'should_ken_respond': bool(data.get('should_ken_respond', False))
+        }
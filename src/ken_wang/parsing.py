@@ -0,0 +1,14 @@
+"""
+KenWang LLM 输出解析工具
+"""
+
+import re
+
+# 整段被 markdown 代码块包裹的响应：```json\n...\n```（结尾围栏可缺省）
+_FENCE_RE = re.compile(r'\A```[^\n]*\n(.*?)(?:\n[ \t]*```)?\Z', re.S)
+
+
+def strip_code_fence(response: str) -> str:
+    """去掉包裹整段响应的 markdown 代码块；response 应已 strip()"""
+    match = _FENCE_RE.match(response)
+    return match.group(1) if match else response
@@ -4,15 +4,62 @@
 使用LLM生成关于人生、生活、健康、家庭、社会等主题的深度问题
 """
 
-import json
 import logging
 import random
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from ..llm import LlmMessage, send_chat_completion, LLMConfig
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
+from functools import lru_cache
+import orjson
+from ..config import ZenAiConfig
+from ..llm import LlmMessage, send_chat_completion, LLMConfig, system_message
+from .parsing import strip_code_fence
 
 logger = logging.getLogger(__name__)
 
+# 过于私人化的关键词，合并为一个正则，一次扫描完成匹配
+PERSONAL_KEYWORDS = ['我家', '我老公', '我老婆', '我孩子', '我妈', '我爸']
+_PERSONAL_KEYWORDS_RE = re.compile('|'.join(map(re.escape, PERSONAL_KEYWORDS)))
+
+# JSON 解析失败时，从引号中提取足够长的问题文本
+_QUOTED_QUESTION_RE = re.compile(r'"([^"]{50,})"')
+
+
+@lru_cache(maxsize=1)
+def _utc_iso_for_second(epoch_second: int) -> str:
+    """UTC ISO 时间（秒级，无时区后缀）；同一秒内的调用复用同一字符串"""
+    return datetime.fromtimestamp(epoch_second, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+# 生成要求与JSON格式固定放在用户提示词开头，主题与问题类型放在末尾，
+# 让每次请求共享同一前缀以命中服务端的前缀缓存
+GENERATION_RUBRIC_PROMPT = """请按文末指定的主题和问题类型生成一个问题。
+
+要求：
+1. 问题长度：80-300字
+2. 真实自然，像一个真实用户的提问
+3. 具有一定深度和讨论价值
+4. 符合指定的问题类型特征
+
+请按照以下JSON格式返回：
+{
+    "question": "问题内容",
+    "complexity": "simple 或 medium 或 complex",
+    "estimated_length": "short 或 medium 或 long (预估KenWang回答的长度)",
+    "tags": ["标签1", "标签2", "标签3"],
+    "reasoning": "为什么这是一个好问题（不会展示给用户）"
+}
+
+注意：
+- complexity: simple=浅显易懂, medium=有一定深度, complex=需要深入探讨
+- estimated_length: 预估KenWang回答需要的篇幅
+- tags: 3-5个相关标签
+- 问题要自然，不要太"教科书"
+"""
+
 
 class QuestionGenerator:
     """智能问题生成器"""
@@ -41,6 +88,9 @@ class QuestionGenerator:
         ]
     }
     
+    # 主题类别（随机选择与批量轮换共用，避免每次重建列表）
+    CATEGORIES = tuple(TOPICS)
+    
     # 问题类型
     QUESTION_TYPES = [
         "困惑求解型",  # "我应该如何..."
@@ -50,8 +100,32 @@ class QuestionGenerator:
         "实践指导型",  # "怎样才能..."
     ]
     
-    def __init__(self, llm_config: LLMConfig):
+    TYPE_DESCRIPTIONS = {
+        "困惑求解型": "表达一个具体的困惑，寻求解决方法",
+        "现象观察型": "观察到某个社会或生活现象，想了解背后的原因",
+        "经验分享型": "询问如何看待某个话题或经历",
+        "深度思考型": "探讨某个概念的本质或意义",
+        "实践指导型": "寻求具体的实践建议或方法"
+    }
+    
+    # 近似重复判定：字符二元组 Jaccard 相似度阈值，与最近多少个问题比较
+    DUPLICATE_SIMILARITY = 0.9
+    SEEN_QUESTIONS_LIMIT = 512
+    
+    def __init__(self, llm_config: LLMConfig, max_concurrency: int):
         self.llm_config = llm_config
+        # 批量生成时同时在途的LLM请求上限
+        self.max_concurrency = max_concurrency
+        # 最近批量生成的问题（字符二元组集合），跨批次去重，容量有上限
+        self._seen_shingles: deque = deque(maxlen=self.SEEN_QUESTIONS_LIMIT)
+        # (category, subtopic, question_type, language) -> 生成提示词
+        # 组合数有限（约150种），首次构建后复用同一字符串
+        self._prompt_cache: Dict[Tuple[str, str, str, str], str] = {}
+    
+    @classmethod
+    def from_config(cls, llm_config: LLMConfig, config: ZenAiConfig) -> 'QuestionGenerator':
+        """按 config.yml 的 ken_wang 段创建"""
+        return cls(llm_config, max_concurrency=config.ken_wang.question_generation_concurrency)
     
     def generate_question(
         self, 
@@ -84,7 +158,7 @@ class QuestionGenerator:
         try:
             # 随机选择主题（如果未指定）
             if not topic_category:
-                topic_category = random.choice(list(self.TOPICS.keys()))
+                topic_category = random.choice(self.CATEGORIES)
             
             if not subtopic:
                 subtopic = random.choice(self.TOPICS[topic_category])
@@ -94,13 +168,17 @@ class QuestionGenerator:
             
             # 构建提示词
             system_prompt = self._build_system_prompt()
-            user_prompt = self._build_generation_prompt(
-                topic_category, subtopic, question_type, language
-            )
+            prompt_key = (topic_category, subtopic, question_type, language)
+            user_prompt = self._prompt_cache.get(prompt_key)
+            if user_prompt is None:
+                user_prompt = self._build_generation_prompt(
+                    topic_category, subtopic, question_type, language
+                )
+                self._prompt_cache[prompt_key] = user_prompt
             
             # 调用LLM
             messages = [
-                LlmMessage(role="system", content=system_prompt),
+                system_message(system_prompt),
                 LlmMessage(role="user", content=user_prompt)
             ]
             response = send_chat_completion(
@@ -117,7 +195,7 @@ class QuestionGenerator:
             result['category'] = topic_category
             result['subtopic'] = subtopic
             result['type'] = question_type
-            result['generated_at'] = datetime.utcnow().isoformat()
+            result['generated_at'] = _utc_iso_for_second(int(time.time()))
             
             logger.info(f"生成问题: {result['question'][:50]}... "
                        f"[{topic_category}/{subtopic}]")
@@ -143,33 +221,52 @@ class QuestionGenerator:
         返回：
             问题列表
         """
-        questions = []
-        
         if diversify:
             # 多样化：确保覆盖不同主题
-            categories = list(self.TOPICS.keys())
-            for i in range(count):
-                category = categories[i % len(categories)]
-                try:
-                    question = self.generate_question(topic_category=category)
-                    questions.append(question)
-                except Exception as e:
-                    logger.error(f"批量生成第{i+1}个问题失败: {e}")
-                    continue
+            categories = self.CATEGORIES
+            topic_categories = [categories[i % len(categories)] for i in range(count)]
         else:
             # 自然分布
-            for i in range(count):
-                try:
-                    question = self.generate_question()
+            topic_categories = [None] * count
+        
+        # 每个问题都是一次独立的LLM往返，并发发出，结果保持原顺序
+        questions = []
+        if count > 0:
+            with ThreadPoolExecutor(max_workers=min(count, self.max_concurrency)) as executor:
+                futures = [
+                    executor.submit(self.generate_question, topic_category=category)
+                    for category in topic_categories
+                ]
+                for i, future in enumerate(futures):
+                    try:
+                        question = future.result()
+                    except Exception as e:
+                        logger.error(f"批量生成第{i+1}个问题失败: {e}")
+                        continue
+                    
+                    if self._is_near_duplicate(question['question']):
+                        logger.info(f"批量生成第{i+1}个问题与已有问题近似重复，已跳过")
+                        continue
                     questions.append(question)
-                except Exception as e:
-                    logger.error(f"批量生成第{i+1}个问题失败: {e}")
-                    continue
         
         logger.info(f"批量生成完成: {len(questions)}/{count} 个问题")
         
         return questions
     
+    def _is_near_duplicate(self, question_text: str) -> bool:
+        """与最近生成的问题比较字符二元组 Jaccard 相似度；不重复时记入历史"""
+        shingles = frozenset(question_text[i:i + 2] for i in range(len(question_text) - 1))
+        if not shingles:
+            return False
+        
+        for seen in self._seen_shingles:
+            overlap = len(shingles & seen)
+            if overlap and overlap / (len(shingles) + len(seen) - overlap) > self.DUPLICATE_SIMILARITY:
+                return True
+        
+        self._seen_shingles.append(shingles)
+        return False
+    
     def _build_system_prompt(self) -> str:
         """构建系统提示词"""
         return """你是一个善于提出深刻问题的思考者。
@@ -201,39 +298,11 @@ class QuestionGenerator:
     ) -> str:
         """构建生成提示词"""
         
-        type_descriptions = {
-            "困惑求解型": "表达一个具体的困惑，寻求解决方法",
-            "现象观察型": "观察到某个社会或生活现象，想了解背后的原因",
-            "经验分享型": "询问如何看待某个话题或经历",
-            "深度思考型": "探讨某个概念的本质或意义",
-            "实践指导型": "寻求具体的实践建议或方法"
-        }
-        
-        return f"""请生成一个关于【{category} - {subtopic}】的问题。
+        return f"""{GENERATION_RUBRIC_PROMPT}
+请生成一个关于【{category} - {subtopic}】的问题。
 
 问题类型：{question_type}
-类型说明：{type_descriptions[question_type]}
-
-要求：
-1. 问题长度：80-300字
-2. 真实自然，像一个真实用户的提问
-3. 具有一定深度和讨论价值
-4. 符合指定的问题类型特征
-
-请按照以下JSON格式返回：
-{{
-    "question": "问题内容",
-    "complexity": "simple 或 medium 或 complex",
-    "estimated_length": "short 或 medium 或 long (预估KenWang回答的长度)",
-    "tags": ["标签1", "标签2", "标签3"],
-    "reasoning": "为什么这是一个好问题（不会展示给用户）"
-}}
-
-注意：
-- complexity: simple=浅显易懂, medium=有一定深度, complex=需要深入探讨
-- estimated_length: 预估KenWang回答需要的篇幅
-- tags: 3-5个相关标签
-- 问题要自然，不要太"教科书"
+类型说明：{self.TYPE_DESCRIPTIONS[question_type]}
 
 现在请生成问题："""
     
@@ -243,13 +312,9 @@ class QuestionGenerator:
             response = response.strip()
             
             # 移除可能的markdown代码块
-            if response.startswith('```'):
-                lines = response.split('\n')
-                start_idx = 1 if lines[0].startswith('```') else 0
-                end_idx = -1 if lines[-1].strip() == '```' else None
-                response = '\n'.join(lines[start_idx:end_idx])
+            response = strip_code_fence(response)
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             # 验证必需字段
             required_fields = ['question', 'complexity', 'estimated_length', 'tags']
@@ -268,15 +333,14 @@ class QuestionGenerator:
                 }
             }
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"无法解析生成结果为JSON: {e}\n响应内容: {response[:200]}")
             
             # 回退：尝试从文本中提取问题
             # 假设问题在引号中或者是第一行
             question = response
             if '"' in response:
-                import re
-                match = re.search(r'"([^"]{50,})"', response)
+                match = _QUOTED_QUESTION_RE.search(response)
                 if match:
                     question = match.group(1)
             
@@ -306,16 +370,16 @@ class QuestionGenerator:
         score = 10
         
         # 长度检查
-        if len(question_text) < 20:
+        length = len(question_text)
+        if length < 20:
             issues.append("问题太短")
             score -= 3
-        elif len(question_text) > 500:
+        elif length > 500:
             issues.append("问题太长")
             score -= 2
         
         # 关键词检查（避免过于私人化）
-        personal_keywords = ['我家', '我老公', '我老婆', '我孩子', '我妈', '我爸']
-        if any(keyword in question_text for keyword in personal_keywords):
+        if _PERSONAL_KEYWORDS_RE.search(question_text):
             issues.append("问题过于私人化")
             suggestions.append("建议改为更普遍的表达方式")
             score -= 2
@@ -377,13 +441,16 @@ TOPIC_INSPIRATIONS = {
     ]
 }
 
+ALL_INSPIRATIONS = tuple(
+    inspiration
+    for inspirations in TOPIC_INSPIRATIONS.values()
+    for inspiration in inspirations
+)
+
 
 def get_inspiration(category: Optional[str] = None) -> str:
     """获取一个灵感示例"""
     if category and category in TOPIC_INSPIRATIONS:
         return random.choice(TOPIC_INSPIRATIONS[category])
     else:
-        all_inspirations = []
-        for inspirations in TOPIC_INSPIRATIONS.values():
-            all_inspirations.extend(inspirations)
-        return random.choice(all_inspirations)
+        return random.choice(ALL_INSPIRATIONS)
@@ -5,31 +5,68 @@ KenWang API 路由 (FastAPI)
 1. POST /ken-wang/moderate - 审核内容（使用通用审核机器人）
 2. POST /ken-wang/write-article - 生成文章
 3. POST /ken-wang/respond-comment - 回复评论
+4. POST /ken-wang/moderate-comments - 批量审核评论（一次LLM调用）
+5. GET  /ken-wang/cache/stats - LLM 响应缓存统计
 """
 
-import json
+import asyncio
+import importlib.util
 import logging
 import sys
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import anyio.to_thread
 import httpx
+import orjson
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
-from ..llm import load_llm_config
+from ..config import load_config
+from ..llm import ResponseCache, load_llm_config
 from .sage import SageWriter
 from .comment_handler import CommentHandler
 from .config import get_zen_content_url, get_internal_api_key
 
 # 导入通用安全审核机器人
 project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root / 'zenheart_robot'))
+
+
+def _load_safety_guard_module():
+    """
+    按文件路径加载 safety_guard_bot（单文件模块或包均可），
+    不向 sys.path 追加目录，避免之后的每次 import 都多扫描一个路径
+    """
+    robot_dir = project_root / 'zenheart_robot'
+    package_init = robot_dir / 'safety_guard_bot' / '__init__.py'
+    if package_init.is_file():
+        spec = importlib.util.spec_from_file_location(
+            'safety_guard_bot', package_init,
+            submodule_search_locations=[str(package_init.parent)]
+        )
+    else:
+        spec = importlib.util.spec_from_file_location(
+            'safety_guard_bot', robot_dir / 'safety_guard_bot.py'
+        )
+    if spec is None or not Path(spec.origin).is_file():
+        raise ImportError(f"No module named 'safety_guard_bot' in {robot_dir}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['safety_guard_bot'] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules['safety_guard_bot']
+        raise
+    return module
+
 
 try:
-    from safety_guard_bot import ContentModerator as SafetyGuard, ContentType
+    _safety_guard_module = _load_safety_guard_module()
+    SafetyGuard = _safety_guard_module.ContentModerator
+    ContentType = _safety_guard_module.ContentType
     SAFETY_GUARD_AVAILABLE = True
 except ImportError as e:
-    logging.warning(f"安全审核机器人不可用: {e}")
+    logging.warning("安全审核机器人不可用: %s", e)
     SAFETY_GUARD_AVAILABLE = False
     SafetyGuard = None
 
@@ -51,14 +88,31 @@ _safety_guard = None  # 安全审核（第一层）
 _ken_wang_moderator = None  # KenWang 质量评估（第二层）
 _sage = None
 _comment_handler = None
+_response_cache: Optional[ResponseCache] = None  # 审核结果的 LLM 响应缓存
+_zen_content_client: Optional[httpx.AsyncClient] = None  # 与 zen_content 通信的长连接池
+_background_tasks: set = set()  # 进行中的后台保存任务
+_inflight_fetches: Dict[str, asyncio.Future] = {}  # 进行中的 zen_content 读取（按资源合并）
+
+# zen_content 内部接口的连接池与超时
+ZEN_CONTENT_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+ZEN_CONTENT_HTTP_TIMEOUT = httpx.Timeout(10.0)
 
 
 def _init_components():
     """初始化 KenWang 组件（两层审核架构）"""
-    global _llm_config, _safety_guard, _ken_wang_moderator, _sage, _comment_handler
+    global _llm_config, _safety_guard, _ken_wang_moderator, _sage, _comment_handler, _response_cache, _zen_content_client
+    
+    if _zen_content_client is None:
+        _zen_content_client = httpx.AsyncClient(
+            base_url=ZEN_CONTENT_URL,
+            limits=ZEN_CONTENT_HTTP_LIMITS,
+            timeout=ZEN_CONTENT_HTTP_TIMEOUT,
+        )
     
     if _llm_config is None:
         _llm_config = load_llm_config()
+        # 审核结果使用精确匹配的 LLM 响应缓存（评论回复是采样生成，不缓存）
+        _response_cache = ResponseCache(max_entries=load_config().response_cache.max_entries)
         
         # 第一层：安全审核机器人（快速过滤违规内容）
         if SAFETY_GUARD_AVAILABLE:
@@ -69,13 +123,53 @@ def _init_components():
             logger.warning("⚠️ 安全审核机器人不可用")
         
         # 第二层：KenWang 质量评估（判断是否撰文）
-        _ken_wang_moderator = KenWangModerator(_llm_config)
+        _ken_wang_moderator = KenWangModerator(_llm_config, response_cache=_response_cache)
         logger.info("✅ KenWang 质量评估器已加载（第二层）")
         
         _sage = SageWriter(_llm_config)
         _comment_handler = CommentHandler(_llm_config)
 
 
+def reset_components() -> None:
+    """
+    丢弃已构建的审核/撰文/评论组件与审核响应缓存，下一次请求按新的 LLM 配置重建
+    
+    zen_content 地址与内部API密钥在导入时读取，修改后仍需重启服务
+    """
+    global _llm_config
+    _llm_config = None
+
+
+def _spawn_background(coro) -> None:
+    """
+    后台执行回传 zen_content 的保存操作，响应不等待其完成
+    
+    保存函数自身已捕获并记录异常；这里保留任务引用防止被GC回收，
+    并记录意外逃逸的异常
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+
+
+def _on_background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("后台保存任务异常: %s", task.exception())
+
+
+async def close_components():
+    """等待未完成的后台保存，再关闭与 zen_content 通信的连接池（应用关闭时调用）"""
+    global _zen_content_client
+    
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+    
+    if _zen_content_client is not None:
+        await _zen_content_client.aclose()
+        _zen_content_client = None
+
+
 # ========================================
 # Request/Response Models
 # ========================================
@@ -93,6 +187,24 @@ class ModerateResponse(BaseModel):
     reason: str = Field(..., description="审核原因")
 
 
+class ModerateCommentsRequest(BaseModel):
+    """批量评论审核请求"""
+    comment_ids: List[int] = Field(..., description="评论ID列表")
+
+
+class CommentModerationItem(BaseModel):
+    """单条评论的审核结果"""
+    comment_id: int
+    action: str = Field(..., description="审核动作: approve/reject")
+    reason: str = Field(..., description="审核原因")
+
+
+class ModerateCommentsResponse(BaseModel):
+    """批量评论审核响应"""
+    success: bool
+    results: List[CommentModerationItem]
+
+
 class WriteArticleRequest(BaseModel):
     """文章生成请求"""
     question_id: int = Field(..., description="问题ID")
@@ -141,60 +253,43 @@ async def moderate_content(request: ModerateRequest):
             detail='审核服务不可用'
         )
     
+    # 获取内容；取不到时直接返回 HTTP 错误，不进入下面的通用异常处理
+    if request.content_type == 'question':
+        content_data = await _get_question_from_zen_content(request.content_id)
+        missing_detail = '无法获取问题内容'
+    elif request.content_type == 'comment':
+        content_data = await _get_comment_from_zen_content(request.content_id)
+        missing_detail = '无法获取评论内容'
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='不支持的内容类型'
+        )
+    
+    if not content_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=missing_detail
+        )
+    
     try:
         if request.content_type == 'question':
-            # 获取问题内容
-            question_data = await _get_question_from_zen_content(request.content_id)
-            
-            if not question_data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail='无法获取问题内容'
-                )
-            
-            question = question_data['question']
-            language = question_data.get('language', 'zh')
+            question = content_data['question']
+            language = content_data.get('language', 'zh')
             
+            # 审核、撰文、回复都是阻塞的LLM调用，放到工作线程执行，避免阻塞事件循环
             # 第一层：安全审核（安检员）
             if _safety_guard:
-                safety_result = _safety_guard.moderate_question(
+                safety_result = await anyio.to_thread.run_sync(partial(
+                    _safety_guard.moderate_question,
                     question=question,
                     language=language
-                )
+                ))
                 
                 if safety_result.is_rejected:
-                    # 安检员拒绝，直接结束，不经过 KenWang
-                    # 构建详细的反馈信息
-                    detailed_feedback = safety_result.reason
-                    
-                    # 添加具体的担忧点
-                    if safety_result.concerns and len(safety_result.concerns) > 0:
-                        concerns_text = '、'.join(safety_result.concerns)
-                        detailed_feedback += f"\n\n具体问题：{concerns_text}"
-                    
-                    # 添加改进建议
-                    if safety_result.suggestions and len(safety_result.suggestions) > 0:
-                        suggestions_text = '；'.join(safety_result.suggestions)
-                        detailed_feedback += f"\n\n建议：{suggestions_text}"
-                    
-                    result = {
-                        'action': 'reject',
-                        'reason': '内容安全审核未通过',
-                        'ken_wang_feedback': detailed_feedback,
-                        'feedback_source': 'safety_guard',  # 标注来源：安检员
-                        'safety_score': safety_result.safety_score,
-                        'quality_score': 0,
-                        'worthy_of_article': False,
-                        'estimated_length': 'short',
-                        'details': {
-                            'safety_guard_reason': safety_result.reason,
-                            'concerns': safety_result.concerns,
-                            'suggestions': safety_result.suggestions
-                        }
-                    }
-                    
-                    logger.warning(f"安检员拒绝: {safety_result.reason}")
-                    await _save_moderation_result_to_zen_content(request.content_id, result)
+                    # 安检员拒绝，直接结束，不经过 KenWang；反馈组装与保存都在后台完成
+                    logger.warning("安检员拒绝: %s", safety_result.reason)
+                    _spawn_background(_persist_safety_rejection(request.content_id, safety_result))
                     
                     return ModerateResponse(
                         success=True,
@@ -203,22 +298,24 @@ async def moderate_content(request: ModerateRequest):
                     )
             
             # 第二层：KenWang 质量评估（判断是否值得撰文）
-            result = _ken_wang_moderator.moderate_question(
+            result = await anyio.to_thread.run_sync(partial(
+                _ken_wang_moderator.moderate_question,
                 question=question,
                 language=language
-            )
+            ))
             
             # 标注反馈来源为 KenWang
             result['feedback_source'] = 'kenwang'
             
             logger.info(
-                f"KenWang 评估: action={result['action']}, "
-                f"quality={result['quality_score']}, "
-                f"feedback={result.get('ken_wang_feedback', 'N/A')[:50]}"
+                "KenWang 评估: action=%s, quality=%s, feedback=%.50s",
+                result['action'],
+                result['quality_score'],
+                result.get('ken_wang_feedback', 'N/A')
             )
             
             # 回传审核结果到zen_content
-            await _save_moderation_result_to_zen_content(request.content_id, result)
+            _spawn_background(_save_moderation_result_to_zen_content(request.content_id, result))
             
             return ModerateResponse(
                 success=True,
@@ -226,26 +323,19 @@ async def moderate_content(request: ModerateRequest):
                 reason=result.get('ken_wang_feedback') or result['reason']
             )
             
-        elif request.content_type == 'comment':
-            # 获取评论内容
-            comment_data = await _get_comment_from_zen_content(request.content_id)
-            
-            if not comment_data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail='无法获取评论内容'
-                )
-            
+        else:
             # 🤖 使用通用审核机器人（LLM 驱动）
-            result = _moderator.moderate_comment(
-                comment=comment_data['content'],
-                language=comment_data.get('language', 'zh')
-            )
+            result = await anyio.to_thread.run_sync(partial(
+                _moderator.moderate_comment,
+                comment=content_data['content'],
+                language=content_data.get('language', 'zh')
+            ))
             
             logger.info(
-                f"评论审核 [LLM驱动]: action={result.action}, "
-                f"safety={result.safety_score}, "
-                f"quality={result.quality_score}"
+                "评论审核 [LLM驱动]: action=%s, safety=%s, quality=%s",
+                result.action,
+                result.safety_score,
+                result.quality_score
             )
             
             # 转换为字典格式
@@ -257,30 +347,91 @@ async def moderate_content(request: ModerateRequest):
             }
             
             # 回传审核结果到zen_content
-            await _save_comment_moderation_result(request.content_id, result_dict)
+            _spawn_background(_save_comment_moderation_result(request.content_id, result_dict))
             
             return ModerateResponse(
                 success=True,
                 action=result.action,
                 reason=result.reason
             )
+            
+    except Exception as e:
+        logger.error("审核失败: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@ken_wang_router.post('/moderate-comments', response_model=ModerateCommentsResponse)
+async def moderate_comments(request: ModerateCommentsRequest):
+    """
+    批量审核评论
+    
+    同一语言的评论合并为一次LLM调用，避免逐条往返
+    """
+    _init_components()
+    
+    if not _ken_wang_moderator:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='审核服务不可用'
+        )
+    
+    try:
+        comments = await asyncio.gather(
+            *(_get_comment_from_zen_content(comment_id) for comment_id in request.comment_ids)
+        )
         
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail='不支持的内容类型'
-            )
+        # 按语言分组（审核身份提示词随语言变化）
+        groups: Dict[str, List[int]] = {}
+        contents: Dict[int, str] = {}
+        for comment_id, comment_data in zip(request.comment_ids, comments):
+            if not comment_data:
+                logger.error("无法获取评论内容: comment_id=%s", comment_id)
+                continue
+            groups.setdefault(comment_data.get('language', 'zh'), []).append(comment_id)
+            contents[comment_id] = comment_data['content']
+        
+        results = []
+        for language, comment_ids in groups.items():
+            verdicts = await anyio.to_thread.run_sync(partial(
+                _ken_wang_moderator.moderate_comments_batch,
+                comments=[contents[comment_id] for comment_id in comment_ids],
+                language=language
+            ))
             
-    except HTTPException:
-        raise
+            for comment_id, verdict in zip(comment_ids, verdicts):
+                _spawn_background(_save_comment_moderation_result(comment_id, verdict))
+            
+            results.extend(
+                CommentModerationItem(
+                    comment_id=comment_id,
+                    action=verdict['action'],
+                    reason=verdict['reason']
+                )
+                for comment_id, verdict in zip(comment_ids, verdicts)
+            )
+        
+        logger.info("批量评论审核: %d/%d 条", len(results), len(request.comment_ids))
+        
+        return ModerateCommentsResponse(success=True, results=results)
+        
     except Exception as e:
-        logger.error(f"审核失败: {e}", exc_info=True)
+        logger.error("批量评论审核失败: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
 
 
+@ken_wang_router.get('/cache/stats')
+async def cache_stats() -> Dict[str, int]:
+    """审核结果 LLM 响应缓存统计（条目数、命中、未命中）"""
+    _init_components()
+    return _response_cache.stats()
+
+
 # ========================================
 # 2. 文章生成接口
 # ========================================
@@ -290,22 +441,23 @@ async def write_article(request: WriteArticleRequest):
     """生成文章"""
     _init_components()
     
+    # 获取问题内容
+    question_data = await _get_question_from_zen_content(request.question_id)
+    
+    if not question_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='无法获取问题内容'
+        )
+    
     try:
-        # 获取问题内容
-        question_data = await _get_question_from_zen_content(request.question_id)
-        
-        if not question_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail='无法获取问题内容'
-            )
-        
         # 生成文章
-        article = _sage.write_article(
+        article = await anyio.to_thread.run_sync(partial(
+            _sage.write_article,
             question=question_data['question'],
             estimated_length=question_data.get('estimated_length', 'medium'),
             language=question_data.get('language', 'zh')
-        )
+        ))
         
         # 保存文章到zen_content
         article['question_id'] = request.question_id
@@ -320,10 +472,8 @@ async def write_article(request: WriteArticleRequest):
             title=article['title']
         )
         
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"文章生成失败: {e}")
+        logger.error("文章生成失败: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -339,16 +489,16 @@ async def respond_comment(request: RespondCommentRequest):
     """回复评论"""
     _init_components()
     
+    # 获取评论内容和文章信息
+    comment_data = await _get_comment_from_zen_content(request.comment_id)
+    
+    if not comment_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='无法获取评论内容'
+        )
+    
     try:
-        # 获取评论内容和文章信息
-        comment_data = await _get_comment_from_zen_content(request.comment_id)
-        
-        if not comment_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail='无法获取评论内容'
-            )
-        
         # 判断是否回复
         should_respond = _comment_handler.should_respond(
             comment=comment_data['content'],
@@ -365,14 +515,15 @@ async def respond_comment(request: RespondCommentRequest):
             )
         
         # 生成回复（传递评论线索）
-        response_data = _comment_handler.generate_response(
+        response_data = await anyio.to_thread.run_sync(partial(
+            _comment_handler.generate_response,
             comment=comment_data['content'],
             article_title=comment_data['article_title'],
             article_summary=comment_data.get('article_summary', ''),
             thread=comment_data.get('thread', []),  # 传递N级跟帖上下文
             is_mentioned=comment_data.get('mentioned_ken', False),
             language=comment_data.get('language', 'zh')
-        )
+        ))
         
         if not response_data:
             return RespondCommentResponse(
@@ -383,14 +534,14 @@ async def respond_comment(request: RespondCommentRequest):
         
         # 记录评论线索深度
         thread_depth = comment_data.get('thread_depth', 0)
-        logger.info(f"KenWang回复评论 (评论线索深度={thread_depth})")
+        logger.info("KenWang回复评论 (评论线索深度=%s)", thread_depth)
         
-        # 保存回复到zen_content
-        await _save_comment_response_to_zen_content(
+        # 保存回复到zen_content（后台执行，不阻塞响应）
+        _spawn_background(_save_comment_response_to_zen_content(
             comment_id=request.comment_id,
             response=response_data['response'],
             tone=response_data['tone']
-        )
+        ))
         
         return RespondCommentResponse(
             success=True,
@@ -398,10 +549,8 @@ async def respond_comment(request: RespondCommentRequest):
             response=response_data['response']
         )
         
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"评论回复失败: {e}")
+        logger.error("评论回复失败: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -412,42 +561,72 @@ async def respond_comment(request: RespondCommentRequest):
 # 辅助函数：与zen_content通信 (异步版本)
 # ========================================
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+async def _post_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+    """以 orjson 序列化请求体后 POST（文章正文可达数 KB，比 httpx 内置的 json.dumps 快）"""
+    return await _zen_content_client.post(
+        url,
+        content=orjson.dumps(payload),
+        headers={**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS,
+        **kwargs
+    )
+
+
+async def _coalesce_fetch(key: str, fetch) -> Optional[Dict[str, Any]]:
+    """
+    合并对同一资源的并发读取：进行中的请求被后来者直接复用，
+    只发出一次 GET；shield 保证单个调用方取消不会中断其他等待者
+    """
+    task = _inflight_fetches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight_fetches[key] = task
+        task.add_done_callback(lambda _: _inflight_fetches.pop(key, None))
+    return await asyncio.shield(task)
+
+
 async def _get_question_from_zen_content(question_id: int) -> Optional[Dict[str, Any]]:
+    """从zen_content获取问题内容（并发请求同一问题时合并）"""
+    return await _coalesce_fetch(
+        f"question:{question_id}",
+        partial(_fetch_question_from_zen_content, question_id)
+    )
+
+
+async def _fetch_question_from_zen_content(question_id: int) -> Optional[Dict[str, Any]]:
     """从zen_content获取问题内容"""
     try:
-        url = f"{ZEN_CONTENT_URL}/mirror/internal/questions/{question_id}"
-        logger.info(f"[DEBUG] 正在请求: {url}")
+        url = f"/mirror/internal/questions/{question_id}"
+        logger.debug("正在请求: %s", url)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=10.0)
+        response = await _zen_content_client.get(url)
         
-        logger.info(f"[DEBUG] 响应状态: {response.status_code}")
+        logger.debug("响应状态: %s", response.status_code)
         
         if response.status_code == 200:
-            data = response.json()
-            logger.info(f"[DEBUG] 获取到问题: {data.get('question', '')[:50]}...")
+            data = orjson.loads(response.content)
+            logger.debug("获取到问题: %.50s...", data.get('question', ''))
             return data
         else:
-            logger.error(f"获取问题失败: {response.status_code}, 响应: {response.text[:200]}")
+            logger.error("获取问题失败: %s, 响应: %.200s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        logger.error(f"获取问题异常: {e}", exc_info=True)
+        logger.error("获取问题异常: %s", e, exc_info=True)
         return None
 
 
 async def _save_moderation_result_to_zen_content(question_id: int, result: dict):
     """将审核结果保存到zen_content"""
     try:
-        url = f"{ZEN_CONTENT_URL}/mirror/internal/moderation/result"
+        url = "/mirror/internal/moderation/result"
         
         # 准备详细信息，包含反馈来源
-        details = result.get('details', {})
-        if isinstance(details, str):
-            try:
-                details = json.loads(details)
-            except:
-                details = {}
+        details = result.get('details') or {}
+        if not isinstance(details, dict):
+            details = {}
         details['feedback_source'] = result.get('feedback_source', 'kenwang')
         
         payload = {
@@ -467,63 +646,102 @@ async def _save_moderation_result_to_zen_content(question_id: int, result: dict)
             'X-API-Key': INTERNAL_API_KEY
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers, timeout=10.0)
+        response = await _post_json(url, payload, headers=headers)
         
         if response.status_code == 200:
-            logger.info(f"审核结果已保存: question_id={question_id}, ken_wang_feedback={result.get('ken_wang_feedback', 'N/A')[:50]}")
+            logger.info("审核结果已保存: question_id=%s, ken_wang_feedback=%.50s", question_id, result.get('ken_wang_feedback', 'N/A'))
         else:
-            logger.error(f"保存审核结果失败: {response.status_code}")
+            logger.error("保存审核结果失败: %s", response.status_code)
             
     except Exception as e:
-        logger.error(f"保存审核结果异常: {e}")
+        logger.error("保存审核结果异常: %s", e)
+
+
+async def _persist_safety_rejection(question_id: int, safety_result):
+    """组装安检员拒绝的详细反馈并保存到zen_content"""
+    # 构建详细的反馈信息
+    detailed_feedback = safety_result.reason
+    
+    # 添加具体的担忧点
+    if safety_result.concerns:
+        concerns_text = '、'.join(safety_result.concerns)
+        detailed_feedback += f"\n\n具体问题：{concerns_text}"
+    
+    # 添加改进建议
+    if safety_result.suggestions:
+        suggestions_text = '；'.join(safety_result.suggestions)
+        detailed_feedback += f"\n\n建议：{suggestions_text}"
+    
+    result = {
+        'action': 'reject',
+        'reason': '内容安全审核未通过',
+        'ken_wang_feedback': detailed_feedback,
+        'feedback_source': 'safety_guard',  # 标注来源：安检员
+        'safety_score': safety_result.safety_score,
+        'quality_score': 0,
+        'worthy_of_article': False,
+        'estimated_length': 'short',
+        'details': {
+            'safety_guard_reason': safety_result.reason,
+            'concerns': safety_result.concerns,
+            'suggestions': safety_result.suggestions
+        }
+    }
+    
+    await _save_moderation_result_to_zen_content(question_id, result)
 
 
 async def _save_article_to_zen_content(article: dict):
     """将文章保存到zen_content"""
     try:
-        url = f"{ZEN_CONTENT_URL}/mirror/internal/articles"
+        url = "/mirror/internal/articles"
         
-        logger.info(f"[DEBUG] 准备保存文章: {article.keys()}")
-        logger.info(f"[DEBUG] tags类型: {type(article.get('tags'))}, metadata类型: {type(article.get('metadata'))}")
+        logger.debug("准备保存文章: %s", article.keys())
+        logger.debug("tags类型: %s, metadata类型: %s", type(article.get('tags')), type(article.get('metadata')))
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=article, timeout=30.0)
+        response = await _post_json(url, article, timeout=30.0)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             article['article_id'] = result.get('article_id')
-            logger.info(f"文章已保存: article_id={article.get('article_id')}")
+            logger.info("文章已保存: article_id=%s", article.get('article_id'))
         else:
-            logger.error(f"保存文章失败: {response.status_code}, 响应: {response.text[:500]}")
+            logger.error("保存文章失败: %s, 响应: %.500s", response.status_code, response.text)
             
     except Exception as e:
-        logger.error(f"保存文章异常: {e}", exc_info=True)
+        logger.error("保存文章异常: %s", e, exc_info=True)
 
 
 async def _get_comment_from_zen_content(comment_id: int) -> Optional[Dict[str, Any]]:
+    """从zen_content获取评论内容（并发请求同一评论时合并）"""
+    return await _coalesce_fetch(
+        f"comment:{comment_id}",
+        partial(_fetch_comment_from_zen_content, comment_id)
+    )
+
+
+async def _fetch_comment_from_zen_content(comment_id: int) -> Optional[Dict[str, Any]]:
     """从zen_content获取评论内容"""
     try:
-        url = f"{ZEN_CONTENT_URL}/mirror/internal/comments/{comment_id}"
+        url = f"/mirror/internal/comments/{comment_id}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=10.0)
+        response = await _zen_content_client.get(url)
         
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         else:
-            logger.error(f"获取评论失败: {response.status_code}")
+            logger.error("获取评论失败: %s", response.status_code)
             return None
             
     except Exception as e:
-        logger.error(f"获取评论异常: {e}")
+        logger.error("获取评论异常: %s", e)
         return None
 
 
 async def _save_comment_moderation_result(comment_id: int, result: dict):
     """将评论审核结果保存到zen_content"""
     try:
-        url = f"{ZEN_CONTENT_URL}/mirror/internal/comments/{comment_id}/moderation"
+        url = f"/mirror/internal/comments/{comment_id}/moderation"
         
         payload = {
             'comment_id': comment_id,
@@ -533,22 +751,21 @@ async def _save_comment_moderation_result(comment_id: int, result: dict):
             'should_ken_respond': result.get('should_ken_respond', False)
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, timeout=10.0)
+        response = await _post_json(url, payload)
         
         if response.status_code == 200:
-            logger.info(f"评论审核结果已保存: comment_id={comment_id}")
+            logger.info("评论审核结果已保存: comment_id=%s", comment_id)
         else:
-            logger.error(f"保存评论审核结果失败: {response.status_code}")
+            logger.error("保存评论审核结果失败: %s", response.status_code)
             
     except Exception as e:
-        logger.error(f"保存评论审核结果异常: {e}")
+        logger.error("保存评论审核结果异常: %s", e)
 
 
 async def _save_comment_response_to_zen_content(comment_id: int, response: str, tone: str):
     """将KenWang的回复保存为新评论"""
     try:
-        url = f"{ZEN_CONTENT_URL}/mirror/internal/comments/ken-response"
+        url = "/mirror/internal/comments/ken-response"
         
         payload = {
             'parent_comment_id': comment_id,
@@ -556,13 +773,12 @@ async def _save_comment_response_to_zen_content(comment_id: int, response: str,
             'tone': tone
         }
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=payload, timeout=10.0)
+        resp = await _post_json(url, payload)
         
         if resp.status_code == 200:
-            logger.info(f"KenWang回复已保存: parent_id={comment_id}")
+            logger.info("KenWang回复已保存: parent_id=%s", comment_id)
         else:
-            logger.error(f"保存回复失败: {resp.status_code}")
+            logger.error("保存回复失败: %s", resp.status_code)
             
     except Exception as e:
-        logger.error(f"保存回复异常: {e}")
+        logger.error("保存回复异常: %s", e)
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
-from .client import LlmMessage, LlmRequest, build_chat_request, send_chat_completion
+from .client import (
+    LlmMessage,
+    LlmRequest,
+    build_chat_request,
+    send_chat_completion,
+    send_chat_completion_async,
+    send_chat_completion_stream,
+    system_message,
+)
 from .config import LLMConfig, load_llm_config
+from .response_cache import ResponseCache
 
 __all__ = [
     "LLMConfig",
@@ -10,4 +19,8 @@ __all__ = [
     "LlmRequest",
     "build_chat_request",
     "send_chat_completion",
+    "send_chat_completion_async",
+    "send_chat_completion_stream",
+    "system_message",
+    "ResponseCache",
 ]
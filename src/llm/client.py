@@ -1,21 +1,42 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import Iterable
+from functools import lru_cache
+from typing import AsyncIterator, Iterable
 from urllib.parse import urljoin
 
+import httpx
 from openai import OpenAI
 
 from .config import LLMConfig
 
+# Process-wide pooled client for the sync OpenAI SDK path: keep-alive + HTTP/2
+# so successive completions reuse the TLS connection to the provider
+_SYNC_HTTP_CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class LlmMessage:
     role: str
     content: str
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=64)
+def system_message(content: str) -> LlmMessage:
+    """Shared system-role message for a fixed prompt (LlmMessage is immutable)"""
+    return LlmMessage(role="system", content=content)
+
+
+def serialize_messages(messages: Iterable[LlmMessage]) -> list[dict[str, str]]:
+    """Wire format shared by the SDK and raw-HTTP paths"""
+    return [{"role": msg.role, "content": msg.content} for msg in messages]
+
+
+@dataclass(frozen=True, slots=True)
 class LlmRequest:
     endpoint: str
     headers: dict[str, str]
@@ -35,28 +56,85 @@ def build_chat_request(
     }
     payload = {
         "model": config.model,
-        "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
+        "messages": serialize_messages(messages),
         "temperature": temperature,
         "max_tokens": max_tokens,
     }
     return LlmRequest(endpoint=endpoint, headers=headers, payload=payload)
 
 
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: str, base_url: str) -> OpenAI:
+    """One SDK client per endpoint/credential, all sharing the pooled HTTP client"""
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=_SYNC_HTTP_CLIENT,
+    )
+
+
 def send_chat_completion(
     config: LLMConfig,
     messages: Iterable[LlmMessage],
     temperature: float,
     max_tokens: int,
 ) -> str:
-    client = OpenAI(
-        api_key=config.api_key,
-        base_url=config.base_url,
-    )
+    client = _get_openai_client(config.api_key, config.base_url)
     response = client.chat.completions.create(
         model=config.model,
-        messages=[{"role": msg.role, "content": msg.content} for msg in messages],
+        messages=serialize_messages(messages),
         temperature=temperature,
         max_tokens=max_tokens,
     )
     content = response.choices[0].message.content
     return content or ""
+
+
+async def send_chat_completion_async(
+    config: LLMConfig,
+    messages: Iterable[LlmMessage],
+    temperature: float,
+    max_tokens: int,
+    http_client: httpx.AsyncClient,
+) -> str:
+    """Send a chat completion over a caller-owned (pooled, keep-alive) async client"""
+    request = build_chat_request(config, messages, temperature, max_tokens)
+    response = await http_client.post(
+        request.endpoint,
+        headers=request.headers,
+        json=request.payload,
+    )
+    response.raise_for_status()
+    content = response.json()["choices"][0]["message"]["content"]
+    return content or ""
+
+
+async def send_chat_completion_stream(
+    config: LLMConfig,
+    messages: Iterable[LlmMessage],
+    temperature: float,
+    max_tokens: int,
+    http_client: httpx.AsyncClient,
+) -> AsyncIterator[str]:
+    """Stream a chat completion, yielding content deltas as the provider emits them (SSE)"""
+    request = build_chat_request(config, messages, temperature, max_tokens)
+    payload = {**request.payload, "stream": True}
+    async with http_client.stream(
+        "POST",
+        request.endpoint,
+        headers=request.headers,
+        json=payload,
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+            choices = json.loads(data).get("choices")
+            if not choices:
+                continue
+            delta = choices[0].get("delta", {}).get("content")
+            if delta:
+                yield delta
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 from pathlib import Path
 
@@ -34,7 +35,9 @@ class LLMConfig:
         )
 
 
+@lru_cache(maxsize=1)
 def load_llm_config() -> LLMConfig:
+    """Read LLM settings from the environment (cached; call cache_clear() to reload)"""
     provider = os.environ.get("ZENAI_LLM_PROVIDER")
     api_key = os.environ.get("ZENAI_LLM_API_KEY")
     base_url = os.environ.get("ZENAI_LLM_BASE_URL")
@@ -162,11 +162,16 @@ def main() -> int:
         scheduler_thread.start()
 
     # Start API server (blocking)
+    # Pin the C event loop / HTTP parser from uvicorn[standard] so a missing
+    # package fails at startup instead of silently degrading (uvloop has no Windows build).
+    # Single worker: the scheduler thread and in-process caches share this process's app_state.
     uvicorn.run(
         app,
         host=args.host,
         port=args.port,
         log_level="info",
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
 
     return 0
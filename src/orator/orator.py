@@ -61,6 +61,43 @@ class ZenAiOrator:
             metadata: Optional metadata
             language: Response language (zh, zh-tw, en, ja, ko)
         """
+        messages, policy, prompt_version = self.prepare_messages(user_input, language)
+        temperature, max_tokens = self.sampling_params(policy)
+
+        # Execute LLM inference
+        error = None
+        try:
+            response_text = send_chat_completion(
+                config=self.llm_config,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        except Exception as exc:
+            response_text = ""
+            error = exc
+
+        return self.record_response(
+            user_input=user_input,
+            response_text=response_text,
+            policy=policy,
+            prompt_version=prompt_version,
+            metadata=metadata,
+            language=language,
+            error=error,
+        )
+
+    def prepare_messages(
+        self,
+        user_input: str,
+        language: str = 'en',
+    ) -> tuple[list[LlmMessage], dict[str, Any], int]:
+        """
+        Load the current prompt and build LLM messages.
+        
+        Returns:
+            (messages, policy, prompt_version)
+        """
         # Load latest prompt
         prompt_record = self.archive.get_latest_prompt()
         if not prompt_record:
@@ -89,22 +126,34 @@ class ZenAiOrator:
             LlmMessage(role="system", content=prompt_text),
             LlmMessage(role="user", content=full_user_input),
         ]
+        return messages, policy, prompt_version
 
-        # Execute LLM inference
-        try:
-            response_text = send_chat_completion(
-                config=self.llm_config,
-                messages=messages,
-                temperature=float(policy.get("temperature", 0.7)),
-                max_tokens=int(policy.get("max_output_tokens", 220)),
-            )
-        except Exception as exc:
-            # Log error and return generic error response
+    @staticmethod
+    def sampling_params(policy: dict[str, Any]) -> tuple[float, int]:
+        """Get (temperature, max_tokens) for a prompt policy"""
+        return float(policy.get("temperature", 0.7)), int(policy.get("max_output_tokens", 220))
+
+    def record_response(
+        self,
+        user_input: str,
+        response_text: str,
+        policy: dict[str, Any],
+        prompt_version: int,
+        metadata: dict[str, Any] | None = None,
+        language: str = 'en',
+        error: Exception | None = None,
+    ) -> OratorResponse:
+        """
+        Record a completed (or failed) LLM answer and build the Orator response.
+        
+        A failed call is stored as a generic error text marked as refusal.
+        """
+        if error is not None:
             # Avoid exposing internal details that might contain sensitive data
             error_msg = "LLM request failed"
-            if "timeout" in str(exc).lower():
+            if "timeout" in str(error).lower():
                 error_msg = "Request timeout"
-            elif "connection" in str(exc).lower():
+            elif "connection" in str(error).lower():
                 error_msg = "Connection failed"
             response_text = f"[System Error: {error_msg}]"
             refusal = True
@@ -205,6 +254,7 @@ class ZenAiOrator:
             LlmMessage(role="user", content=user_prompt),
         ]
 
+        # Sampled at temperature 0.7, so explanations are not cached
         try:
             explanation = send_chat_completion(
                 config=self.llm_config,
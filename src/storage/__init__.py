@@ -10,9 +10,11 @@ from .database import (
     create_database,
     get_session_maker,
 )
+from .feedback_writer import FeedbackWriter
 
 __all__ = [
     "ResonanceArchive",
+    "FeedbackWriter",
     "InteractionRecord",
     "IterationSession",
     "MetricsSnapshot",
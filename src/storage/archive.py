@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Sequence
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, attributes
 
 from ..core.models import Interaction, IterationMetrics
@@ -26,18 +27,30 @@ class ResonanceArchive:
     Implements the Resonance Archive layer from design spec.
     """
     db_path: str | Path
+    pool_size: int  # paths.database_pool_size from config.yml
     engine: Any = None
     session_maker: Any = None
 
     def __post_init__(self):
         if self.engine is None:
-            self.engine = create_database(self.db_path)
+            self.engine = create_database(self.db_path, self.pool_size)
             self.session_maker = get_session_maker(self.engine)
 
     def create_session(self) -> Session:
         """Create a new database session"""
         return self.session_maker()
 
+    def warm_up(self) -> None:
+        """
+        Open every pooled connection ahead of the first request.
+        Connections are held together so the pool creates pool_size distinct ones,
+        then checked back in with PRAGMAs already applied.
+        """
+        connections = [self.engine.connect() for _ in range(self.pool_size)]
+        for connection in connections:
+            connection.exec_driver_sql("SELECT 1")
+            connection.close()
+
     # ========================================
     # Interaction Management
     # ========================================
@@ -82,18 +95,31 @@ class ResonanceArchive:
             feedback: Standard feedback type (resonance/rejection/ignore)
             feedback_data: Additional feedback data (behavior, comment, etc.)
         """
+        self.update_interactions_feedback([(interaction_id, feedback, feedback_data)])
+
+    def update_interactions_feedback(
+        self,
+        updates: Sequence[tuple[int, str, dict[str, Any] | None]],
+    ) -> None:
+        """
+        Apply several feedback updates in a single transaction
+        
+        Args:
+            updates: (interaction_id, feedback, feedback_data) tuples, applied in order
+        """
         with self.create_session() as session:
-            record = session.query(InteractionRecord).filter_by(id=interaction_id).first()
-            if record:
-                record.feedback = feedback
-                # Merge feedback_data into existing extra_data
-                if feedback_data:
-                    existing_data = record.extra_data or {}
-                    existing_data.update(feedback_data)
-                    record.extra_data = existing_data
-                    # Mark the JSON field as modified so SQLAlchemy tracks it
-                    attributes.flag_modified(record, 'extra_data')
-                session.commit()
+            for interaction_id, feedback, feedback_data in updates:
+                record = session.get(InteractionRecord, interaction_id)
+                if record:
+                    record.feedback = feedback
+                    # Merge feedback_data into existing extra_data
+                    if feedback_data:
+                        existing_data = record.extra_data or {}
+                        existing_data.update(feedback_data)
+                        record.extra_data = existing_data
+                        # Mark the JSON field as modified so SQLAlchemy tracks it
+                        attributes.flag_modified(record, 'extra_data')
+            session.commit()
 
     def load_interactions_by_iteration(
         self,
@@ -221,6 +247,11 @@ class ResonanceArchive:
                 .first()
             )
 
+    def get_latest_iteration_id(self) -> int | None:
+        """Get the most recent iteration ID (primary-key lookup, no row load)"""
+        with self.create_session() as session:
+            return session.execute(select(func.max(IterationSession.id))).scalar()
+
     def get_iteration(self, iteration_id: int) -> IterationSession | None:
         """Get specific iteration by ID"""
         with self.create_session() as session:
@@ -286,23 +317,29 @@ class ResonanceArchive:
         Returns:
             List of dicts containing complete gatha data
         """
+        # Column tuples only: no ORM identity-map / entity construction per row
         with self.create_session() as session:
-            iterations = (
-                session.query(IterationSession)
-                .filter(IterationSession.gatha_metadata.isnot(None))
+            rows = session.execute(
+                select(
+                    IterationSession.id,
+                    IterationSession.end_time,
+                    IterationSession.state,
+                    IterationSession.metrics,
+                    IterationSession.gatha_metadata,
+                )
+                .where(IterationSession.gatha_metadata.isnot(None))
                 .order_by(IterationSession.id.desc())
                 .limit(limit)
-                .all()
-            )
+            ).all()
             return [
                 {
-                    "iteration_id": it.id,
-                    "end_time": it.end_time.isoformat() if it.end_time else None,
-                    "state": it.state,
-                    "metrics": it.metrics,
-                    **it.gatha_metadata,  # Unpack complete gatha data
+                    "iteration_id": iteration_id,
+                    "end_time": end_time.isoformat() if end_time else None,
+                    "state": state,
+                    "metrics": metrics,
+                    **gatha_metadata,  # Unpack complete gatha data
                 }
-                for it in iterations
+                for iteration_id, end_time, state, metrics, gatha_metadata in rows
             ]
 
     # ========================================
@@ -441,6 +478,17 @@ class ResonanceArchive:
         with self.create_session() as session:
             return session.query(IterationSession).count()
 
+    def get_counts(self) -> tuple[int, int]:
+        """Get (total interactions, total iterations) in a single query"""
+        with self.create_session() as session:
+            interactions, iterations = session.execute(
+                select(
+                    select(func.count()).select_from(InteractionRecord).scalar_subquery(),
+                    select(func.count()).select_from(IterationSession).scalar_subquery(),
+                )
+            ).one()
+            return interactions, iterations
+
     # ========================================
     # Helper Methods
     # ========================================
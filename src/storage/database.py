@@ -5,7 +5,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String, Text, create_engine
+import orjson
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String, Text, create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 Base = declarative_base()
@@ -104,12 +105,49 @@ class SystemStatus(Base):
         return f"<SystemStatus(key={self.key}, value={self.value})>"
 
 
-def create_database(db_path: str | Path) -> Any:
+# Applied once to every new pooled connection
+SQLITE_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_CONNECT_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _json_serializer(value: Any) -> str:
+    # JSON columns (metrics, policy, extra_data, gatha_metadata) are encoded with orjson;
+    # non-str keys are stringified the way json.dumps does. NaN/Infinity are written
+    # as null (json.dumps used to write the non-standard NaN/Infinity literals)
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _json_deserializer(value: str | bytes) -> Any:
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # Rows written by json.dumps may hold NaN/Infinity, which orjson rejects
+        return json.loads(value)
+
+
+def create_database(db_path: str | Path, pool_size: int) -> Any:
     """Create database engine and initialize tables"""
     db_file = Path(db_path)
     db_file.parent.mkdir(parents=True, exist_ok=True)
     
-    engine = create_engine(f"sqlite:///{db_file}", echo=False)
+    engine = create_engine(
+        f"sqlite:///{db_file}",
+        echo=False,
+        pool_size=pool_size,
+        json_serializer=_json_serializer,
+        json_deserializer=_json_deserializer,
+    )
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
     Base.metadata.create_all(engine)
     return engine
 
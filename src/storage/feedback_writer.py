@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any
+
+from .archive import ResonanceArchive
+
+FeedbackUpdate = tuple[int, str, dict[str, Any] | None]
+
+# Same logger the /feedback handler uses, so write failures land next to it
+logger = logging.getLogger("zenai.feedback")
+
+
+class FeedbackWriter:
+    """
+    Background writer for interaction feedback.
+    
+    Request handlers enqueue updates and return immediately; a single thread
+    collects up to batch_size updates (or waits at most flush_interval seconds)
+    and commits them in one transaction.
+    """
+
+    def __init__(
+        self,
+        archive: ResonanceArchive,
+        max_pending: int,
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.archive = archive
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[FeedbackUpdate | None] = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="feedback-writer", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit(
+        self,
+        interaction_id: int,
+        feedback: str,
+        feedback_data: dict[str, Any] | None,
+    ) -> bool:
+        """Queue an update; returns False when the queue is full"""
+        try:
+            self._queue.put_nowait((interaction_id, feedback, feedback_data))
+        except queue.Full:
+            return False
+        return True
+
+    def stop(self) -> None:
+        """Flush pending updates and stop the writer thread"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+
+    def _flush(self, batch: list[FeedbackUpdate]) -> None:
+        try:
+            self.archive.update_interactions_feedback(batch)
+            return
+        except Exception:
+            logger.exception("Batch write of %d feedback updates failed; retrying one by one", len(batch))
+        
+        # The batch transaction rolled back as a whole; apply each update on its
+        # own so one bad row (or a transient error) doesn't drop the others
+        for interaction_id, feedback, feedback_data in batch:
+            try:
+                self.archive.update_interaction_feedback(interaction_id, feedback, feedback_data)
+            except Exception:
+                logger.exception(
+                    "Dropping feedback update for interaction %s (feedback=%s, data=%r)",
+                    interaction_id,
+                    feedback,
+                    feedback_data,
+                )
@@ -65,7 +65,7 @@ def main() -> int:
         print(f"Using temporary database: {db_path}")
     
     # Initialize archive
-    archive = ResonanceArchive(db_path=db_path)
+    archive = ResonanceArchive(db_path=db_path, pool_size=config.paths.database_pool_size)
     
     # Create initial prompt
     initial_policy = PromptPolicy(